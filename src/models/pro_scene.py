@@ -2,12 +2,14 @@
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ProPlayerInfo(BaseModel):
     """Pro player with enriched data."""
 
+    model_config = ConfigDict(defer_build=True)
+
     account_id: int = Field(description="Player's Steam account ID")
     name: str = Field(description="Professional name")
     personaname: Optional[str] = Field(default=None, description="Steam persona name")
@@ -32,6 +34,8 @@ class ProPlayerInfo(BaseModel):
 class TeamInfo(BaseModel):
     """Team with enriched data."""
 
+    model_config = ConfigDict(defer_build=True)
+
     team_id: int = Field(description="Team ID")
     name: str = Field(description="Team name")
     tag: str = Field(description="Team tag/abbreviation")
@@ -45,6 +49,8 @@ class TeamInfo(BaseModel):
 class RosterEntry(BaseModel):
     """A player's tenure on a team."""
 
+    model_config = ConfigDict(defer_build=True)
+
     account_id: int = Field(description="Player account ID")
     player_name: str = Field(description="Player's pro name")
     team_id: int = Field(description="Team ID")
@@ -63,6 +69,8 @@ class RosterEntry(BaseModel):
 class LeagueInfo(BaseModel):
     """League/tournament information."""
 
+    model_config = ConfigDict(defer_build=True)
+
     league_id: int = Field(description="League ID")
     name: str = Field(description="League name")
     tier: Optional[str] = Field(
@@ -73,6 +81,8 @@ class LeagueInfo(BaseModel):
 class ProMatchSummary(BaseModel):
     """Summary of a pro match for tournament context."""
 
+    model_config = ConfigDict(defer_build=True)
+
     match_id: int = Field(description="Match ID")
     radiant_team_id: Optional[int] = Field(default=None, description="Radiant team ID")
     radiant_team_name: Optional[str] = Field(default=None, description="Radiant team name")
@@ -97,6 +107,8 @@ class ProMatchSummary(BaseModel):
 class SeriesSummary(BaseModel):
     """Summary of a series (Bo1, Bo3, Bo5)."""
 
+    model_config = ConfigDict(defer_build=True)
+
     series_id: int = Field(description="Series ID")
     series_type: int = Field(description="Series type: 0=Bo1, 1=Bo3, 2=Bo5")
     series_type_name: str = Field(description="Human readable: Bo1, Bo3, Bo5")
@@ -120,6 +132,8 @@ class SeriesSummary(BaseModel):
 class SearchResult(BaseModel):
     """A fuzzy search result."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: int = Field(
         description="Entity ID (account_id for players, team_id for teams)"
     )
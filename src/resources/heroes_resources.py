@@ -7,7 +7,7 @@ from python_manta import Hero
 
 from src.models.hero_counters import HeroCounters, HeroCountersDatabase
 from src.utils.constants_fetcher import constants_fetcher
-from src.utils.match_fetcher import MatchFetcher
+from src.utils.match_fetcher import match_fetcher
 from src.utils.pro_scene_fetcher import pro_scene_fetcher
 from src.utils.replay_downloader import ReplayDownloader
 
@@ -21,7 +21,7 @@ class HeroesResource:
         """Initialize the heroes resource."""
         self.replay_downloader = ReplayDownloader()
         self.constants = constants_fetcher
-        self.match_fetcher = MatchFetcher()
+        self.match_fetcher = match_fetcher
         self._hero_counters: Optional[HeroCountersDatabase] = None
 
     def _load_hero_counters(self) -> Optional[HeroCountersDatabase]:
@@ -235,8 +235,7 @@ class HeroesResource:
         Returns:
             List of player data with hero info, lane, and role
         """
-        fetcher = MatchFetcher()
-        players = await fetcher.get_players(match_id)
+        players = await self.match_fetcher.get_players(match_id)
 
         if not players:
             logger.error(f"Could not fetch player data for match {match_id}")
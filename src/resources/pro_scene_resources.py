@@ -2,6 +2,7 @@
 
 import logging
 from collections import defaultdict
+from operator import attrgetter
 from typing import Any, Dict, List, Optional, Tuple
 
 from opendota import OpenDota
@@ -28,6 +29,10 @@ from src.utils.team_fuzzy_search import team_fuzzy_search
 
 logger = logging.getLogger(__name__)
 
+# OpenDota series_type -> display name and wins needed to take the series
+_SERIES_TYPE_NAMES: Dict[int, str] = {0: "Bo1", 1: "Bo3", 2: "Bo5"}
+_SERIES_WINS_NEEDED: Dict[int, int] = {0: 1, 1: 2, 2: 3}
+
 
 class ProSceneResource:
     """Resource for accessing pro scene data."""
@@ -340,7 +345,8 @@ class ProSceneResource:
 
     def _series_type_to_name(self, series_type: int) -> str:
         """Convert series_type to human-readable name."""
-        return {0: "Bo1", 1: "Bo3", 2: "Bo5"}.get(series_type, f"Bo{series_type}")
+        name = _SERIES_TYPE_NAMES.get(series_type)
+        return name if name is not None else f"Bo{series_type}"
 
     async def _build_team_lookup(self) -> Dict[int, str]:
         """Build team_id -> team_name lookup from cached teams data."""
@@ -360,28 +366,15 @@ class ProSceneResource:
             dire_name = team_lookup.get(match.dire_team_id)
 
         if radiant_name != match.radiant_team_name or dire_name != match.dire_team_name:
-            return ProMatchSummary(
-                match_id=match.match_id,
-                radiant_team_id=match.radiant_team_id,
-                radiant_team_name=radiant_name,
-                dire_team_id=match.dire_team_id,
-                dire_team_name=dire_name,
-                radiant_win=match.radiant_win,
-                radiant_score=match.radiant_score,
-                dire_score=match.dire_score,
-                duration=match.duration,
-                start_time=match.start_time,
-                league_id=match.league_id,
-                league_name=match.league_name,
-                series_id=match.series_id,
-                series_type=match.series_type,
-                game_number=match.game_number,
+            # The match is already validated; copy it with the two names swapped in
+            return match.model_copy(
+                update={"radiant_team_name": radiant_name, "dire_team_name": dire_name}
             )
         return match
 
     def _wins_needed(self, series_type: int) -> int:
         """Calculate wins needed to win the series."""
-        return {0: 1, 1: 2, 2: 3}.get(series_type, 1)
+        return _SERIES_WINS_NEEDED.get(series_type, 1)
 
     def _group_matches_into_series(
         self, matches: List[ProMatchSummary]
@@ -399,11 +392,7 @@ class ProSceneResource:
         series_list: List[SeriesSummary] = []
 
         for series_id, games in series_matches.items():
-            games_sorted = sorted(games, key=lambda g: g.start_time)
-
-            for i, game in enumerate(games_sorted):
-                game.game_number = i + 1
-
+            games_sorted = sorted(games, key=attrgetter("start_time"))
             first_game = games_sorted[0]
             series_type = first_game.series_type or 0
 
@@ -415,17 +404,14 @@ class ProSceneResource:
             team1_wins = 0
             team2_wins = 0
 
-            for game in games_sorted:
-                if game.radiant_win:
-                    if game.radiant_team_id == team1_id:
-                        team1_wins += 1
-                    else:
-                        team2_wins += 1
+            # Number the games and tally wins in the same pass
+            for game_number, game in enumerate(games_sorted, start=1):
+                game.game_number = game_number
+                game_winner_id = game.radiant_team_id if game.radiant_win else game.dire_team_id
+                if game_winner_id == team1_id:
+                    team1_wins += 1
                 else:
-                    if game.dire_team_id == team1_id:
-                        team1_wins += 1
-                    else:
-                        team2_wins += 1
+                    team2_wins += 1
 
             wins_needed = self._wins_needed(series_type)
             is_complete = team1_wins >= wins_needed or team2_wins >= wins_needed
@@ -439,8 +425,9 @@ class ProSceneResource:
                 winner_id = team2_id
                 winner_name = team2_name
 
+            # Every field is derived from already-validated ProMatchSummary games
             series_list.append(
-                SeriesSummary(
+                SeriesSummary.model_construct(
                     series_id=series_id,
                     series_type=series_type,
                     series_type_name=self._series_type_to_name(series_type),
@@ -460,12 +447,12 @@ class ProSceneResource:
                 )
             )
 
-        series_list.sort(key=lambda s: s.start_time, reverse=True)
+        series_list.sort(key=attrgetter("start_time"), reverse=True)
 
         all_matches = standalone_matches + [
             game for series in series_list for game in series.games
         ]
-        all_matches.sort(key=lambda m: m.start_time, reverse=True)
+        all_matches.sort(key=attrgetter("start_time"), reverse=True)
 
         return all_matches, series_list
 
@@ -627,7 +614,7 @@ class ProSceneResource:
                 filtered_matches.append(match)
 
             # Sort by start_time descending and apply limit
-            matches = sorted(filtered_matches, key=lambda x: x.start_time, reverse=True)[:limit]
+            matches = sorted(filtered_matches, key=attrgetter("start_time"), reverse=True)[:limit]
 
             all_matches, series_list = self._group_matches_into_series(matches)
 
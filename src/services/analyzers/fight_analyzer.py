@@ -12,7 +12,8 @@ Detects:
 """
 
 from collections import defaultdict
-from typing import Dict, List, Optional, Set, Tuple
+from types import MappingProxyType
+from typing import AbstractSet, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from ..models.combat_data import (
     BKBBlinkCombo,
@@ -30,7 +31,7 @@ from ..models.combat_data import (
 
 # Big teamfight abilities that matter when hitting multiple heroes
 # Format: internal_name -> (display_name, min_heroes_for_highlight)
-BIG_TEAMFIGHT_ABILITIES: Dict[str, tuple] = {
+BIG_TEAMFIGHT_ABILITIES: Mapping[str, tuple] = MappingProxyType({
     # Stuns/Disables
     "faceless_void_chronosphere": ("Chronosphere", 2),
     "enigma_black_hole": ("Black Hole", 2),
@@ -100,7 +101,7 @@ BIG_TEAMFIGHT_ABILITIES: Dict[str, tuple] = {
     "oracle_false_promise": ("False Promise", 1),
     "abaddon_borrowed_time": ("Borrowed Time", 1),
     "omniknight_guardian_angel": ("Guardian Angel", 1),
-}
+})
 
 # Modifiers that indicate ability hit (some abilities apply modifiers)
 ABILITY_MODIFIERS: Dict[str, str] = {
@@ -143,21 +144,21 @@ BKB_BLINK_WINDOW = 1.5  # BKB -> Blink -> Ability within this window
 COORDINATED_ULT_WINDOW = 3.0  # Two heroes ulting within this time = coordinated
 
 # Blink items for initiation detection
-BLINK_ITEMS = {
+BLINK_ITEMS: FrozenSet[str] = frozenset({
     "item_blink",
     "item_swift_blink",
     "item_arcane_blink",
     "item_overwhelming_blink",
-}
+})
 
 # Save items/abilities - self-banish or immunity
-SELF_SAVE_ITEMS = {
+SELF_SAVE_ITEMS: Mapping[str, str] = MappingProxyType({
     "item_outworld_staff": "self_banish",  # OD staff - banish self
     "item_aeon_disk": "self_immunity",  # Aeon Disk proc
     "item_satanic": "self_heal",  # Satanic active
-}
+})
 
-SELF_SAVE_ABILITIES = {
+SELF_SAVE_ABILITIES: Mapping[str, str] = MappingProxyType({
     "puck_phase_shift": "self_banish",
     "ember_spirit_sleight_of_fist": "self_invulnerable",
     "juggernaut_blade_fury": "self_magic_immune",
@@ -166,18 +167,18 @@ SELF_SAVE_ABILITIES = {
     "storm_spirit_ball_lightning": "self_invulnerable",
     "void_spirit_dissimilate": "self_hidden",
     "faceless_void_time_walk": "self_invulnerable",
-}
+})
 
 # Ally save items - cast on ally to save them
-ALLY_SAVE_ITEMS = {
+ALLY_SAVE_ITEMS: Mapping[str, str] = MappingProxyType({
     "item_glimmer_cape": "ally_glimmer",
     "item_force_staff": "ally_force",
     "item_hurricane_pike": "ally_force",
     "item_lotus_orb": "ally_lotus",
-}
+})
 
 # Ally save abilities
-ALLY_SAVE_ABILITIES = {
+ALLY_SAVE_ABILITIES: Mapping[str, str] = MappingProxyType({
     "oracle_false_promise": "ally_save",
     "dazzle_shallow_grave": "ally_grave",
     "omniknight_guardian_angel": "ally_immunity",
@@ -187,10 +188,10 @@ ALLY_SAVE_ABILITIES = {
     "naga_siren_song_of_the_siren": "ally_song",
     "chen_hand_of_god": "ally_heal",
     "io_relocate": "ally_relocate",
-}
+})
 
 # Dangerous channeled abilities that can be cancelled
-CHANNELED_ABILITIES = {
+CHANNELED_ABILITIES: FrozenSet[str] = frozenset({
     "juggernaut_omni_slash",
     "witch_doctor_death_ward",
     "crystal_maiden_freezing_field",
@@ -199,14 +200,14 @@ CHANNELED_ABILITIES = {
     "pudge_dismember",
     "shadow_shaman_shackles",
     "pugna_life_drain",
-}
+})
 
 # Abilities where target becoming untargetable ends the ability early
-TARGET_REQUIRED_ABILITIES = {
+TARGET_REQUIRED_ABILITIES: FrozenSet[str] = frozenset({
     "juggernaut_omni_slash",
     "juggernaut_swiftslash",
     "lifestealer_infest",
-}
+})
 
 
 class FightAnalyzer:
@@ -240,8 +241,8 @@ class FightAnalyzer:
         self,
         events: List[CombatLogEvent],
         deaths: List[HeroDeath],
-        radiant_heroes: Optional[Set[str]] = None,
-        dire_heroes: Optional[Set[str]] = None,
+        radiant_heroes: Optional[AbstractSet[str]] = None,
+        dire_heroes: Optional[AbstractSet[str]] = None,
     ) -> FightHighlights:
         """
         Analyze fight events and extract highlights.
@@ -529,8 +530,8 @@ class FightAnalyzer:
     def _detect_team_wipes(
         self,
         deaths: List[HeroDeath],
-        radiant_heroes: Set[str],
-        dire_heroes: Set[str],
+        radiant_heroes: AbstractSet[str],
+        dire_heroes: AbstractSet[str],
     ) -> List[TeamWipe]:
         """
         Detect team wipes (all 5 heroes of one team dead).
@@ -679,8 +680,8 @@ class FightAnalyzer:
     def _detect_coordinated_ults(
         self,
         events: List[CombatLogEvent],
-        radiant_heroes: Optional[Set[str]] = None,
-        dire_heroes: Optional[Set[str]] = None,
+        radiant_heroes: Optional[AbstractSet[str]] = None,
+        dire_heroes: Optional[AbstractSet[str]] = None,
     ) -> List[CoordinatedUltimates]:
         """
         Detect when 2+ heroes from the SAME TEAM use big ultimates together.
@@ -7,8 +7,9 @@ before anyone dies, and properly captures the initiation phase.
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from typing import Deque, List, Optional, Set
 
 from ..models.combat_data import CombatLogEvent, Fight, FightResult, HeroDeath
 
@@ -41,7 +42,7 @@ SERIOUS_COMBAT_ABILITIES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatWindow:
     """A window of combat activity."""
 
@@ -113,12 +114,6 @@ class FightDetector:
         self.combat_gap = combat_gap
         self.teamfight_threshold = teamfight_threshold
 
-    def _format_time(self, seconds: float) -> str:
-        """Format game time as M:SS."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes}:{secs:02d}"
-
     def _clean_hero_name(self, name: str) -> str:
         """Remove npc_dota_hero_ prefix."""
         if name and name.startswith("npc_dota_hero_"):
@@ -207,13 +202,16 @@ class FightDetector:
         current = CombatWindow()
         current.start_time = combat_events[0].game_time
         current.end_time = combat_events[0].game_time
-        recent_events: List[float] = []  # Track event times for intensity calc
+        # Event times inside the intensity window; times only grow, so expired
+        # entries are always at the left end
+        recent_events: Deque[float] = deque()
 
         for event in combat_events:
             event_time = event.game_time
 
             # Remove old events from intensity tracking
-            recent_events = [t for t in recent_events if event_time - t <= INTENSITY_WINDOW]
+            while recent_events and event_time - recent_events[0] > INTENSITY_WINDOW:
+                recent_events.popleft()
 
             # Calculate gap since last event
             gap = event_time - current.end_time if current.event_count > 0 else 0
@@ -234,7 +232,7 @@ class FightDetector:
                 # Start new window
                 current = CombatWindow()
                 current.start_time = event_time
-                recent_events = []
+                recent_events.clear()
 
             # Update current window
             current.end_time = event_time
@@ -285,9 +283,7 @@ class FightDetector:
         return Fight(
             fight_id=f"fight_{fight_number}",
             start_time=window.start_time,
-            start_time_str=self._format_time(window.start_time),
             end_time=window.end_time,
-            end_time_str=self._format_time(window.end_time),
             duration=window.duration,
             deaths=window.deaths,
             participants=sorted(list(window.heroes_involved)),
@@ -355,9 +351,7 @@ class FightDetector:
         return Fight(
             fight_id=f"fight_{fight_number}",
             start_time=start_time,
-            start_time_str=self._format_time(start_time),
             end_time=end_time,
-            end_time_str=self._format_time(end_time),
             duration=end_time - start_time,
             deaths=deaths,
             participants=sorted(list(participants)),
@@ -428,14 +422,32 @@ class FightDetector:
             Fight containing reference_time, or None
         """
         result = self.detect_fights_from_combat(events, deaths)
+        return self.find_fight_at_time(result.fights, reference_time, hero)
 
-        if not result.fights:
+    def find_fight_at_time(
+        self,
+        fights: List[Fight],
+        reference_time: float,
+        hero: Optional[str] = None,
+    ) -> Optional[Fight]:
+        """
+        Pick the fight containing (or nearest to) reference_time from detected fights.
+
+        Args:
+            fights: Fights from detect_fights_from_combat
+            reference_time: Game time to search around
+            hero: Optional hero filter
+
+        Returns:
+            Fight containing reference_time, or the nearest one, or None
+        """
+        if not fights:
             return None
 
         best_fight = None
         best_distance = float('inf')
 
-        for fight in result.fights:
+        for fight in fights:
             # Check if reference_time is within fight (with buffer)
             if fight.start_time - 3.0 <= reference_time <= fight.end_time + 5.0:
                 if hero:
@@ -61,12 +61,12 @@ class ReplayCache:
         cached = self._cache.get(cache_key)
 
         if cached is not None:
-            logger.debug(f"Cache hit for match {match_id}")
+            logger.debug("Cache hit for match %s", match_id)
             # LRU behavior: reset TTL on access
             self._cache.touch(cache_key, expire=self._ttl)
             return ParsedReplayData.from_cache_dict(cached)
 
-        logger.debug(f"Cache miss for match {match_id}")
+        logger.debug("Cache miss for match %s", match_id)
         return None
 
     def set(self, match_id: int, data: ParsedReplayData) -> None:
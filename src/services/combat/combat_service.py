@@ -5,7 +5,12 @@ NO MCP DEPENDENCIES - can be used from any interface.
 """
 
 import logging
-from typing import List, Optional, Tuple
+import math
+import sys
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
 
 from python_manta import CombatLogType, Team
 
@@ -43,6 +48,31 @@ MAX_EVENTS_CAP = 500
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=8192)
+def _format_seconds(seconds: int) -> str:
+    """Format whole game seconds as M:SS (memoized: a match spans a few thousand seconds)."""
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _clean_name(name: str) -> str:
+    """Strip the npc_dota_hero_ prefix and intern the result.
+
+    Every event naming the same unit then shares one string object, so
+    equality checks and hashing on hero names hit the identity fast path.
+    """
+    if name.startswith("npc_dota_hero_"):
+        name = name[14:]
+    return sys.intern(name)
+
+
+@lru_cache(maxsize=4096)
+def _lower_name(name: str) -> str:
+    """Lowercase a unit/ability name, memoized (combat logs repeat a few hundred names)."""
+    return name.lower()
+
+
 RUNE_TYPE_MAP = {
     0: "double_damage",
     1: "haste",
@@ -52,6 +82,19 @@ RUNE_TYPE_MAP = {
     5: "shield",
 }
 
+# Combat log type id -> event type name used in CombatLogEvent.type
+EVENT_TYPE_NAMES = {
+    CombatLogType.DAMAGE.value: "DAMAGE",
+    CombatLogType.HEAL.value: "HEAL",
+    CombatLogType.MODIFIER_ADD.value: "MODIFIER_ADD",
+    CombatLogType.MODIFIER_REMOVE.value: "MODIFIER_REMOVE",
+    CombatLogType.DEATH.value: "DEATH",
+    CombatLogType.ABILITY.value: "ABILITY",
+    CombatLogType.ITEM.value: "ITEM",
+    CombatLogType.PURCHASE.value: "PURCHASE",
+    CombatLogType.BUYBACK.value: "BUYBACK",
+}
+
 
 class CombatService:
     """
@@ -67,9 +110,8 @@ class CombatService:
 
     def _format_time(self, seconds: float) -> str:
         """Format game time as M:SS."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{minutes}:{secs:02d}"
+        # Flooring first gives the same minutes/seconds split, negatives included
+        return _format_seconds(math.floor(seconds))
 
     def _get_hero_position_at_time(
         self,
@@ -111,9 +153,7 @@ class CombatService:
 
     def _clean_hero_name(self, name: str) -> str:
         """Remove npc_dota_hero_ prefix from hero name."""
-        if name.startswith("npc_dota_hero_"):
-            return name[14:]
-        return name
+        return _clean_name(name)
 
     def _normalize_ability_name(
         self, inflictor_name: Optional[str], attacker_is_hero: bool
@@ -185,8 +225,9 @@ class CombatService:
             List of HeroDeath events sorted by game time
         """
         deaths = []
+        hero_lower = hero_filter.lower() if hero_filter else None
 
-        for entry in data.combat_log_entries:
+        for entry in data.combat_log_in_range(start_time, end_time):
             entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
             if entry_type != CombatLogType.DEATH.value:
                 continue
@@ -195,17 +236,12 @@ class CombatService:
                 continue
 
             game_time = entry.game_time
-            if start_time is not None and game_time < start_time:
-                continue
-            if end_time is not None and game_time > end_time:
-                continue
 
             killer = self._clean_hero_name(entry.attacker_name)
             victim = self._clean_hero_name(entry.target_name)
 
-            if hero_filter:
-                hero_lower = hero_filter.lower()
-                if hero_lower not in killer.lower() and hero_lower not in victim.lower():
+            if hero_lower:
+                if hero_lower not in _lower_name(killer) and hero_lower not in _lower_name(victim):
                     continue
 
             # Get victim position from entity snapshots
@@ -243,7 +279,6 @@ class CombatService:
             )
             deaths.append(death)
 
-        deaths.sort(key=lambda d: d.game_time)
         return deaths
 
     def get_damage_events(
@@ -268,8 +303,9 @@ class CombatService:
             List of DamageEvent sorted by game time
         """
         events = []
+        hero_lower = hero_filter.lower() if hero_filter else None
 
-        for entry in data.combat_log_entries:
+        for entry in data.combat_log_in_range(start_time, end_time):
             entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
             if entry_type != CombatLogType.DAMAGE.value:
                 continue
@@ -278,17 +314,12 @@ class CombatService:
                 continue
 
             game_time = entry.game_time
-            if start_time is not None and game_time < start_time:
-                continue
-            if end_time is not None and game_time > end_time:
-                continue
 
             attacker = self._clean_hero_name(entry.attacker_name)
             target = self._clean_hero_name(entry.target_name)
 
-            if hero_filter:
-                hero_lower = hero_filter.lower()
-                if hero_lower not in attacker.lower() and hero_lower not in target.lower():
+            if hero_lower:
+                if hero_lower not in _lower_name(attacker) and hero_lower not in _lower_name(target):
                     continue
 
             event = DamageEvent(
@@ -303,7 +334,6 @@ class CombatService:
             )
             events.append(event)
 
-        events.sort(key=lambda e: e.game_time)
         return events
 
     def get_item_purchases(
@@ -322,6 +352,7 @@ class CombatService:
             List of ItemPurchase events sorted by game time
         """
         purchases = []
+        hero_lower = hero_filter.lower() if hero_filter else None
 
         for entry in data.combat_log_entries:
             entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
@@ -330,8 +361,8 @@ class CombatService:
 
             hero = self._clean_hero_name(entry.target_name)
 
-            if hero_filter:
-                if hero_filter.lower() not in hero.lower():
+            if hero_lower:
+                if hero_lower not in _lower_name(hero):
                     continue
 
             purchase = ItemPurchase(
@@ -363,6 +394,7 @@ class CombatService:
         """
         pickups = []
         seen_times: dict[tuple[str, float], bool] = {}
+        hero_lower = hero_filter.lower() if hero_filter else None
 
         # Rune map for modifier_rune_* inflictor names
         rune_modifier_map = {
@@ -380,7 +412,7 @@ class CombatService:
             # Check PICKUP_RUNE events (type 21)
             if entry_type == CombatLogType.PICKUP_RUNE.value:
                 hero = self._clean_hero_name(entry.target_name)
-                if hero_filter and hero_filter.lower() not in hero.lower():
+                if hero_lower and hero_lower not in _lower_name(hero):
                     continue
                 rune_type = RUNE_TYPE_MAP.get(entry.value, f"unknown_{entry.value}")
                 pickup = RunePickup(
@@ -398,7 +430,7 @@ class CombatService:
                 inflictor = getattr(entry, 'inflictor_name', '')
                 if inflictor in rune_modifier_map:
                     hero = self._clean_hero_name(entry.attacker_name)
-                    if hero_filter and hero_filter.lower() not in hero.lower():
+                    if hero_lower and hero_lower not in _lower_name(hero):
                         continue
 
                     # Dedupe - same hero/time can have duplicate modifier events
@@ -430,7 +462,7 @@ class CombatService:
             if entry_type != CombatLogType.DEATH.value:
                 continue
 
-            if "roshan" not in entry.target_name.lower():
+            if "roshan" not in _lower_name(entry.target_name):
                 continue
 
             kill_number += 1
@@ -460,7 +492,7 @@ class CombatService:
             if entry_type != CombatLogType.DEATH.value:
                 continue
 
-            target = entry.target_name.lower()
+            target = _lower_name(entry.target_name)
             # Tormentor is named "npc_dota_miniboss" in replay data
             if "miniboss" not in target:
                 continue
@@ -494,7 +526,7 @@ class CombatService:
             if entry_type != CombatLogType.DEATH.value:
                 continue
 
-            target = entry.target_name.lower()
+            target = _lower_name(entry.target_name)
             if "tower" not in target or "badguys" not in target and "goodguys" not in target:
                 continue
 
@@ -525,7 +557,7 @@ class CombatService:
             if entry_type != CombatLogType.DEATH.value:
                 continue
 
-            target = entry.target_name.lower()
+            target = _lower_name(entry.target_name)
             if "rax" not in target and "barrack" not in target:
                 continue
 
@@ -556,7 +588,7 @@ class CombatService:
             if entry_type != CombatLogType.DEATH.value:
                 continue
 
-            target = entry.target_name.lower()
+            target = _lower_name(entry.target_name)
             if "courier" not in target:
                 continue
 
@@ -604,18 +636,7 @@ class CombatService:
 
     def _get_event_type_name(self, entry_type: int) -> str:
         """Get human-readable event type name."""
-        type_map = {
-            CombatLogType.DAMAGE.value: "DAMAGE",
-            CombatLogType.HEAL.value: "HEAL",
-            CombatLogType.MODIFIER_ADD.value: "MODIFIER_ADD",
-            CombatLogType.MODIFIER_REMOVE.value: "MODIFIER_REMOVE",
-            CombatLogType.DEATH.value: "DEATH",
-            CombatLogType.ABILITY.value: "ABILITY",
-            CombatLogType.ITEM.value: "ITEM",
-            CombatLogType.PURCHASE.value: "PURCHASE",
-            CombatLogType.BUYBACK.value: "BUYBACK",
-        }
-        return type_map.get(entry_type, f"UNKNOWN_{entry_type}")
+        return EVENT_TYPE_NAMES.get(entry_type) or f"UNKNOWN_{entry_type}"
 
     def _passes_detail_level_filter(
         self,
@@ -689,22 +710,48 @@ class CombatService:
         Returns:
             List of CombatLogEvent sorted by game time
         """
-        events = []
+        events = self.iter_combat_log(
+            data,
+            start_time=start_time,
+            end_time=end_time,
+            hero_filter=hero_filter,
+            ability_filter=ability_filter,
+            types=types,
+            detail_level=detail_level,
+        )
+        if max_events is not None:
+            events = islice(events, max(max_events, 0))
+        return list(events)
+
+    def iter_combat_log(
+        self,
+        data: ParsedReplayData,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        hero_filter: Optional[str] = None,
+        ability_filter: Optional[str] = None,
+        types: Optional[List[int]] = None,
+        detail_level: DetailLevel = DetailLevel.FULL,
+    ) -> Iterator[CombatLogEvent]:
+        """
+        Lazily yield filtered combat log events in game-time order.
+
+        Same filters as get_combat_log, but events are built only as they are
+        consumed, so callers looking for the first match stop early.
+        """
         ability_filter_lower = ability_filter.lower() if ability_filter else None
+        hero_lower = hero_filter.lower() if hero_filter else None
+        type_set = frozenset(types) if types is not None else None
 
-        for entry in data.combat_log_entries:
+        # Time filter via binary search on the time-sorted combat log
+        for entry in data.combat_log_in_range(start_time, end_time):
             entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
 
             # Type filter
-            if types is not None and entry_type not in types:
+            if type_set is not None and entry_type not in type_set:
                 continue
 
-            # Time filter
             game_time = entry.game_time
-            if start_time is not None and game_time < start_time:
-                continue
-            if end_time is not None and game_time > end_time:
-                continue
 
             # Apply detail level filter
             if not self._passes_detail_level_filter(
@@ -719,15 +766,14 @@ class CombatService:
             target = self._clean_hero_name(entry.target_name)
 
             # Hero filter
-            if hero_filter:
-                hero_lower = hero_filter.lower()
-                if hero_lower not in attacker.lower() and hero_lower not in target.lower():
+            if hero_lower:
+                if hero_lower not in _lower_name(attacker) and hero_lower not in _lower_name(target):
                     continue
 
             # Ability filter
             if ability_filter_lower:
                 ability = entry.inflictor_name or ""
-                if ability_filter_lower not in ability.lower():
+                if ability_filter_lower not in _lower_name(ability):
                     continue
 
             # Determine if ability "hit" (for ABILITY events)
@@ -746,11 +792,14 @@ class CombatService:
                 if tgt_lvl and tgt_lvl > 0:
                     target_level = tgt_lvl
 
-            event = CombatLogEvent(
+            # Fields come typed from python-manta, so skip per-event validation;
+            # only the CoercedInt fields need their int() coercion applied here
+            value = entry.value if hasattr(entry, 'value') else None
+            event = CombatLogEvent.model_construct(
                 type=self._get_event_type_name(entry_type),
                 game_time=game_time,
                 game_time_str=self._format_time(game_time),
-                tick=entry.tick,
+                tick=int(entry.tick) if entry.tick is not None else None,
                 attacker=attacker,
                 attacker_is_hero=entry.is_attacker_hero,
                 attacker_level=attacker_level,
@@ -758,22 +807,10 @@ class CombatService:
                 target_is_hero=entry.is_target_hero,
                 target_level=target_level,
                 ability=self._normalize_ability_name(entry.inflictor_name, entry.is_attacker_hero),
-                value=entry.value if hasattr(entry, 'value') else None,
+                value=int(value) if value is not None else None,
                 hit=hit,
             )
-            events.append(event)
-
-            # Check max_events cap
-            if max_events is not None and len(events) >= max_events:
-                break
-
-        events.sort(key=lambda e: e.game_time)
-
-        # Apply max_events after sorting (in case we added unsorted)
-        if max_events is not None and len(events) > max_events:
-            events = events[:max_events]
-
-        return events
+            yield event
 
     # ============ Response methods (return API Response models) ============
 
@@ -1013,24 +1050,24 @@ class CombatService:
         death_level_disadvantages: List[int] = []
 
         # First pass: count ALL ability usage across the entire match
-        match_ability_casts: dict = {}
-        match_ability_hits: dict = {}
+        match_ability_casts: Counter[str] = Counter()
+        match_ability_hits: Counter[str] = Counter()
 
         for entry in data.combat_log_entries:
             entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
             attacker = self._clean_hero_name(entry.attacker_name)
-            attacker_lower = attacker.lower()
+            attacker_lower = _lower_name(attacker)
             is_our_hero_attacker = hero_lower in attacker_lower
 
             if entry_type == CombatLogType.ABILITY.value and is_our_hero_attacker:
                 ability = entry.inflictor_name
                 if ability and ability != "dota_unknown":
                     # Apply ability filter if specified
-                    if ability_filter_lower and ability_filter_lower not in ability.lower():
+                    if ability_filter_lower and ability_filter_lower not in _lower_name(ability):
                         continue
-                    match_ability_casts[ability] = match_ability_casts.get(ability, 0) + 1
+                    match_ability_casts[ability] += 1
                     if entry.is_target_hero:
-                        match_ability_hits[ability] = match_ability_hits.get(ability, 0) + 1
+                        match_ability_hits[ability] += 1
 
             elif entry_type == CombatLogType.MODIFIER_ADD.value:
                 modifier = entry.inflictor_name
@@ -1039,7 +1076,7 @@ class CombatService:
                         for tracked_ability in match_ability_casts.keys():
                             ability_base = tracked_ability.split("_")[-1]
                             if ability_base in modifier.lower():
-                                match_ability_hits[tracked_ability] = match_ability_hits.get(tracked_ability, 0) + 1
+                                match_ability_hits[tracked_ability] += 1
                                 break
 
         # Second pass: per-fight breakdown
@@ -1055,8 +1092,8 @@ class CombatService:
             assists = 0
             damage_dealt = 0
             damage_received = 0
-            ability_casts: dict = {}
-            ability_hits: dict = {}
+            ability_casts: Counter[str] = Counter()
+            ability_hits: Counter[str] = Counter()
             heroes_damaged_by_hero: set = set()
 
             for entry in data.combat_log_entries:
@@ -1066,8 +1103,8 @@ class CombatService:
 
                 attacker = self._clean_hero_name(entry.attacker_name)
                 target = self._clean_hero_name(entry.target_name)
-                attacker_lower = attacker.lower()
-                target_lower = target.lower()
+                attacker_lower = _lower_name(attacker)
+                target_lower = _lower_name(target)
                 is_our_hero_attacker = hero_lower in attacker_lower
                 is_our_hero_target = hero_lower in target_lower
 
@@ -1102,11 +1139,11 @@ class CombatService:
                     ability = entry.inflictor_name
                     if ability and ability != "dota_unknown":
                         # Apply ability filter if specified
-                        if ability_filter_lower and ability_filter_lower not in ability.lower():
+                        if ability_filter_lower and ability_filter_lower not in _lower_name(ability):
                             continue
-                        ability_casts[ability] = ability_casts.get(ability, 0) + 1
+                        ability_casts[ability] += 1
                         if entry.is_target_hero:
-                            ability_hits[ability] = ability_hits.get(ability, 0) + 1
+                            ability_hits[ability] += 1
 
                 elif entry_type == CombatLogType.MODIFIER_ADD.value:
                     modifier = entry.inflictor_name
@@ -1115,7 +1152,7 @@ class CombatService:
                             for tracked_ability in ability_casts.keys():
                                 ability_base = tracked_ability.split("_")[-1]
                                 if ability_base in modifier.lower():
-                                    ability_hits[tracked_ability] = ability_hits.get(tracked_ability, 0) + 1
+                                    ability_hits[tracked_ability] += 1
                                     break
 
             abilities_used = []
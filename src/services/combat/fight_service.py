@@ -6,7 +6,7 @@ Uses combat-intensity based detection to catch fights without deaths.
 """
 
 import logging
-from typing import List, Optional, Set
+from typing import FrozenSet, List, Optional, Tuple
 
 from ...models.combat_log import DetailLevel
 from ..analyzers.fight_analyzer import FightAnalyzer
@@ -202,39 +202,17 @@ class FightService:
             if any(hero_lower in p.lower() for p in f.participants)
         ]
 
-    def _get_team_heroes(self, data: ParsedReplayData) -> tuple:
+    def _get_team_heroes(self, data: ParsedReplayData) -> Tuple[FrozenSet[str], FrozenSet[str]]:
         """
-        Extract radiant and dire hero sets from entity snapshots.
+        Get radiant and dire hero sets for a replay.
+
+        Delegates to ParsedReplayData.team_heroes, which scans the entity
+        snapshots once per replay.
 
         Returns:
-            Tuple of (radiant_heroes: Set[str], dire_heroes: Set[str])
+            Tuple of (radiant_heroes, dire_heroes)
         """
-        radiant_heroes: Set[str] = set()
-        dire_heroes: Set[str] = set()
-
-        # Find a snapshot after laning phase starts (game_time > 60s)
-        # The first snapshot may not have all heroes spawned yet
-        for snapshot in data.entity_snapshots:
-            if snapshot.game_time < 60:
-                continue
-
-            if hasattr(snapshot, 'heroes') and snapshot.heroes:
-                for hero_snap in snapshot.heroes:
-                    hero_name = hero_snap.hero_name
-                    if hero_name and hero_name.startswith("npc_dota_hero_"):
-                        clean_name = hero_name[14:]
-                        # player_id 0-4 = radiant, 5-9 = dire
-                        if hasattr(hero_snap, 'player_id'):
-                            if hero_snap.player_id < 5:
-                                radiant_heroes.add(clean_name)
-                            else:
-                                dire_heroes.add(clean_name)
-
-            # Stop once we have all 10 heroes
-            if len(radiant_heroes) == 5 and len(dire_heroes) == 5:
-                break
-
-        return radiant_heroes, dire_heroes
+        return data.team_heroes()
 
     def get_fight_combat_log(
         self,
@@ -280,6 +258,57 @@ class FightService:
         if not fight:
             return None
 
+        return self._build_fight_context(
+            data, fight, self._get_team_heroes(data), detail_level, max_events
+        )
+
+    def get_all_fight_combat_logs(
+        self,
+        data: ParsedReplayData,
+        reference_times: List[float],
+        hero: Optional[str] = None,
+        detail_level: DetailLevel = DetailLevel.NARRATIVE,
+        max_events: Optional[int] = None,
+    ) -> List[Optional[dict]]:
+        """
+        Batch version of get_fight_combat_log for many reference times.
+
+        The full combat log, hero deaths, combat-based fight detection and
+        team rosters run once and are shared across all reference times.
+
+        Args:
+            data: ParsedReplayData from ReplayService
+            reference_times: Game times to anchor each fight search
+            hero: Optional hero name to anchor fight detection
+            detail_level: Controls verbosity of returned events (NARRATIVE, TACTICAL, FULL)
+            max_events: Maximum events to return per fight (None = no limit)
+
+        Returns:
+            One fight context dict (see get_fight_combat_log) or None per reference time
+        """
+        all_events = self._combat.get_combat_log(data, detail_level=DetailLevel.FULL)
+        deaths = self._combat.get_hero_deaths(data)
+        fights = self._detector.detect_fights_from_combat(all_events, deaths).fights
+        team_heroes = self._get_team_heroes(data)
+
+        results: List[Optional[dict]] = []
+        for reference_time in reference_times:
+            fight = self._detector.find_fight_at_time(fights, reference_time, hero)
+            results.append(
+                self._build_fight_context(data, fight, team_heroes, detail_level, max_events)
+                if fight else None
+            )
+        return results
+
+    def _build_fight_context(
+        self,
+        data: ParsedReplayData,
+        fight: Fight,
+        team_heroes: Tuple[FrozenSet[str], FrozenSet[str]],
+        detail_level: DetailLevel,
+        max_events: Optional[int],
+    ) -> dict:
+        """Slice the combat log around a detected fight and analyze highlights."""
         # Get events within fight boundaries (with buffer)
         start_time = fight.start_time - 2.0
         end_time = fight.end_time + 2.0
@@ -294,15 +323,18 @@ class FightService:
         )
 
         # Get ALL events for highlight detection (fight already includes initiation)
-        highlight_events = self._combat.get_combat_log(
-            data,
-            start_time=start_time,
-            end_time=end_time,
-            detail_level=DetailLevel.FULL,
-        )
+        if detail_level == DetailLevel.FULL and max_events is None:
+            highlight_events = response_events
+        else:
+            highlight_events = self._combat.get_combat_log(
+                data,
+                start_time=start_time,
+                end_time=end_time,
+                detail_level=DetailLevel.FULL,
+            )
 
-        # Get team rosters for ace detection
-        radiant_heroes, dire_heroes = self._get_team_heroes(data)
+        # Team rosters for ace detection
+        radiant_heroes, dire_heroes = team_heroes
 
         # Analyze fight for highlights
         highlights = self._analyzer.analyze_fight(
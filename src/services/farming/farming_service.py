@@ -9,6 +9,7 @@ NO MCP DEPENDENCIES.
 
 import logging
 from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from python_manta import CombatLogType, NeutralCampType
@@ -87,6 +88,9 @@ CAMP_TIERS = {
     "small": ["small_kobold", "small_troll", "small_ghost", "small_vhoul", "small_gnoll"],
 }
 
+# Reverse index: camp type -> tier
+CAMP_TYPE_TO_TIER = {camp: tier for tier, camps in CAMP_TIERS.items() for camp in camps}
+
 # NeutralCampType enum to string tier mapping
 NEUTRAL_CAMP_TYPE_TO_TIER = {
     NeutralCampType.SMALL.value: "small",
@@ -96,6 +100,31 @@ NEUTRAL_CAMP_TYPE_TO_TIER = {
 }
 
 
+@lru_cache(maxsize=1024)
+def _classify_creep_name(target_name: str) -> Tuple[str, Optional[str]]:
+    """Classify a creep name (memoized: a match only has a few dozen distinct units)."""
+    if not target_name:
+        return ("other", None)
+
+    target_lower = target_name.lower()
+
+    # Lane creeps
+    if "npc_dota_creep_goodguys" in target_lower or "npc_dota_creep_badguys" in target_lower:
+        return ("lane", None)
+
+    # Neutral creeps
+    if "npc_dota_neutral" in target_lower:
+        # Try to identify specific camp type
+        for pattern, camp_type in NEUTRAL_CAMP_PATTERNS.items():
+            if pattern in target_lower:
+                return ("neutral", camp_type)
+        # Generic neutral
+        return ("neutral", "unknown")
+
+    # Other (wards, summons, etc.)
+    return ("other", None)
+
+
 class FarmingService:
     """
     Service for farming pattern analysis.
@@ -115,9 +144,7 @@ class FarmingService:
 
     def _clean_hero_name(self, name: str) -> str:
         """Remove npc_dota_hero_ prefix."""
-        if name and name.startswith("npc_dota_hero_"):
-            return name[14:]
-        return name or ""
+        return (name or "").removeprefix("npc_dota_hero_")
 
     def _is_hero(self, name: str) -> bool:
         """Check if a name is a hero."""
@@ -132,35 +159,13 @@ class FarmingService:
             creep_type is 'lane', 'neutral', or 'other'
             neutral_camp_type is the specific camp type or None
         """
-        if not target_name:
-            return ("other", None)
-
-        target_lower = target_name.lower()
-
-        # Lane creeps
-        if "npc_dota_creep_goodguys" in target_lower or "npc_dota_creep_badguys" in target_lower:
-            return ("lane", None)
-
-        # Neutral creeps
-        if "npc_dota_neutral" in target_lower:
-            # Try to identify specific camp type
-            for pattern, camp_type in NEUTRAL_CAMP_PATTERNS.items():
-                if pattern in target_lower:
-                    return ("neutral", camp_type)
-            # Generic neutral
-            return ("neutral", "unknown")
-
-        # Other (wards, summons, etc.)
-        return ("other", None)
+        return _classify_creep_name(target_name)
 
     def _get_camp_tier(self, camp_type: Optional[str]) -> Optional[str]:
         """Get the tier (ancient/large/medium/small) of a camp type."""
         if not camp_type:
             return None
-        for tier, camps in CAMP_TIERS.items():
-            if camp_type in camps:
-                return tier
-        return None
+        return CAMP_TYPE_TO_TIER.get(camp_type)
 
     def _get_creep_kills(
         self,
@@ -3,13 +3,19 @@ Data models for combat analysis.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional
 
 # Import shared models from API layer (re-export for backwards compatibility)
 from ...models.combat_log import CombatLogEvent, HeroDeath  # noqa: F401
 
 
-@dataclass
+def _format_game_time(seconds: float) -> str:
+    """Format game time as M:SS."""
+    return f"{int(seconds // 60)}:{int(seconds % 60):02d}"
+
+
+@dataclass(slots=True)
 class DamageEvent:
     """A damage event from combat log."""
 
@@ -23,21 +29,27 @@ class DamageEvent:
     target_is_hero: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Fight:
     """A fight containing one or more hero deaths."""
 
     fight_id: str
     start_time: float
-    start_time_str: str
     end_time: float
-    end_time_str: str
     duration: float
     deaths: List[HeroDeath] = field(default_factory=list)
     participants: List[str] = field(default_factory=list)
     radiant_deaths: int = 0
     dire_deaths: int = 0
 
+    @property
+    def start_time_str(self) -> str:
+        return _format_game_time(self.start_time)
+
+    @property
+    def end_time_str(self) -> str:
+        return _format_game_time(self.end_time)
+
     @property
     def total_deaths(self) -> int:
         return len(self.deaths)
@@ -60,8 +72,21 @@ class FightResult:
     def skirmishes(self) -> int:
         return self.total_fights - self.teamfights
 
+    @cached_property
+    def fights_by_start_str(self) -> Dict[str, Fight]:
+        """
+        Fights keyed by start time string (e.g. "48:08"); first fight wins on ties.
 
-@dataclass
+        Built once on first access and not refreshed, so ``fights`` must not be
+        changed after the index has been read.
+        """
+        index: Dict[str, Fight] = {}
+        for fight in self.fights:
+            index.setdefault(fight.start_time_str, fight)
+        return index
+
+
+@dataclass(slots=True)
 class ItemPurchase:
     """An item purchase event."""
 
@@ -72,7 +97,7 @@ class ItemPurchase:
     item: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RunePickup:
     """A rune pickup event."""
 
@@ -83,7 +108,7 @@ class RunePickup:
     rune_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectiveKill:
     """An objective kill (Roshan, tower, barracks, etc.)."""
 
@@ -97,7 +122,7 @@ class ObjectiveKill:
     extra_info: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CourierKill:
     """A courier kill event."""
 
@@ -4,8 +4,10 @@ Data models for parsed replay data.
 Wraps python-manta v2 ParseResult with additional derived data.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+import bisect
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, Dict, FrozenSet, List, Optional, Protocol, Set, Tuple
 
 from python_manta import (
     CombatLogEntry,
@@ -80,6 +82,16 @@ class ParsedReplayData:
     # Index for seeking (built on first parse)
     demo_index: Optional[DemoIndex] = None
 
+    # Time-sorted combat log and its game_time column (built on first use, not cached)
+    _combat_log_time_index: Optional[Tuple[List[CombatLogEntry], List[float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # (radiant, dire) hero names from entity snapshots (built on first use, not cached)
+    _team_heroes: Optional[Tuple[FrozenSet[str], FrozenSet[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # Convenience accessors
     @property
     def combat_log_entries(self) -> List[CombatLogEntry]:
@@ -95,6 +107,70 @@ class ParsedReplayData:
             return self.entities.snapshots
         return []
 
+    def combat_log_in_range(
+        self, start_time: Optional[float] = None, end_time: Optional[float] = None
+    ) -> List[CombatLogEntry]:
+        """
+        Get combat log entries with start_time <= game_time <= end_time.
+
+        Uses binary search over a time-sorted copy of the combat log, so a
+        window query only touches the entries inside it.
+
+        Args:
+            start_time: Lower bound (inclusive), None for no lower bound
+            end_time: Upper bound (inclusive), None for no upper bound
+
+        Returns:
+            Entries in the window, sorted by game time
+        """
+        if self._combat_log_time_index is None:
+            entries = sorted(self.combat_log_entries, key=attrgetter("game_time"))
+            self._combat_log_time_index = (entries, [e.game_time for e in entries])
+
+        entries, times = self._combat_log_time_index
+        lo = 0 if start_time is None else bisect.bisect_left(times, start_time)
+        hi = len(times) if end_time is None else bisect.bisect_right(times, end_time)
+        return entries[lo:hi]
+
+    def team_heroes(self) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        """
+        Get radiant and dire hero names from entity snapshots.
+
+        Built on first use from the first snapshots after the 60s mark
+        (earlier ones may not have every hero spawned).
+
+        Returns:
+            Tuple of (radiant_heroes, dire_heroes)
+        """
+        if self._team_heroes is not None:
+            return self._team_heroes
+
+        radiant_heroes: Set[str] = set()
+        dire_heroes: Set[str] = set()
+
+        for snapshot in self.entity_snapshots:
+            if snapshot.game_time < 60:
+                continue
+
+            if hasattr(snapshot, 'heroes') and snapshot.heroes:
+                for hero_snap in snapshot.heroes:
+                    hero_name = hero_snap.hero_name
+                    if hero_name and hero_name.startswith("npc_dota_hero_"):
+                        clean_name = hero_name[14:]
+                        # player_id 0-4 = radiant, 5-9 = dire
+                        if hasattr(hero_snap, 'player_id'):
+                            if hero_snap.player_id < 5:
+                                radiant_heroes.add(clean_name)
+                            else:
+                                dire_heroes.add(clean_name)
+
+            # Stop once we have all 10 heroes
+            if len(radiant_heroes) == 5 and len(dire_heroes) == 5:
+                break
+
+        self._team_heroes = (frozenset(radiant_heroes), frozenset(dire_heroes))
+        return self._team_heroes
+
     @property
     def winner(self) -> Optional[str]:
         """Get match winner (radiant/dire)."""
@@ -83,15 +83,16 @@ def register_match_tools(mcp, services):
 
         players = []
         for p in timeline.get("players", []):
+            kda = p.get("kda_timeline") or {}
             kda_timeline = [
-                KDASnapshot(
-                    game_time=k.get("game_time", 0),
-                    kills=k.get("kills", 0),
-                    deaths=k.get("deaths", 0),
-                    assists=k.get("assists", 0),
-                    level=k.get("level", 0),
+                KDASnapshot(game_time=gt, kills=k, deaths=d, assists=a, level=lvl)
+                for gt, k, d, a, lvl in zip(
+                    kda.get("game_time", []),
+                    kda.get("kills", []),
+                    kda.get("deaths", []),
+                    kda.get("assists", []),
+                    kda.get("level", []),
                 )
-                for k in p.get("kda_timeline", [])
             ]
             players.append(
                 PlayerTimeline(
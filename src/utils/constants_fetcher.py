@@ -5,7 +5,7 @@ Constants fetcher utility for downloading and caching Dota 2 constants from dota
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
@@ -105,6 +105,9 @@ class ConstantsFetcher:
         # Ensure constants directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
+        # filename -> (mtime_ns, parsed JSON) for files already loaded from disk
+        self._local_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
     async def fetch_constants_file(self, filename: str) -> Optional[Dict[str, Any]]:
         """
         Fetch a single constants file from the repository.
@@ -171,6 +174,9 @@ class ConstantsFetcher:
         """
         Load constants from local cache.
 
+        Parsed files are kept in memory and only re-read when the file's
+        mtime changes, so callers must treat the returned dict as read-only.
+
         Args:
             filename: Name of the constants file
 
@@ -180,13 +186,21 @@ class ConstantsFetcher:
         local_file = self.data_dir / filename
 
         try:
-            if local_file.exists():
-                with open(local_file, 'r') as f:
-                    return json.load(f)
-            else:
+            try:
+                mtime_ns = local_file.stat().st_mtime_ns
+            except FileNotFoundError:
                 logger.warning(f"Local constants file not found: {filename}")
                 return None
 
+            cached = self._local_cache.get(filename)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+
+            with open(local_file, 'r') as f:
+                data = json.load(f)
+            self._local_cache[filename] = (mtime_ns, data)
+            return data
+
         except Exception as e:
             logger.error(f"Failed to load local constants {filename}: {e}")
             return None
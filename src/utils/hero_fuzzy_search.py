@@ -5,7 +5,7 @@ Fuzzy hero search utility using simplified heroes data and constants integration
 import json
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.resources.heroes_resources import heroes_resource
 
@@ -16,6 +16,8 @@ class HeroFuzzySearch:
     def __init__(self):
         """Initialize fuzzy search with heroes data."""
         self._fuzzy_data = {}
+        # (hero key, hero data, [(name or alias, lowercased/stripped form)])
+        self._search_index: List[Tuple[str, Dict[str, Any], List[Tuple[str, str]]]] = []
         self._load_fuzzy_data()
 
     def _load_fuzzy_data(self):
@@ -28,11 +30,27 @@ class HeroFuzzySearch:
         with open(fuzzy_file, 'r') as f:
             self._fuzzy_data = json.load(f)
 
+        self._search_index = [
+            (
+                hero_key,
+                hero_data,
+                [(name, name.lower().strip()) for name in [hero_data['name'], *hero_data['aliases']]],
+            )
+            for hero_key, hero_data in self._fuzzy_data.items()
+        ]
+
     def _calculate_similarity(self, search_term: str, alias: str) -> float:
         """Calculate similarity between search term and alias."""
-        search_lower = search_term.lower().strip()
-        alias_lower = alias.lower().strip()
+        return self._score(search_term.lower().strip(), alias.lower().strip())
+
+    @staticmethod
+    def _score(search_lower: str, alias_lower: str, cutoff: float = 0.0) -> float:
+        """
+        Similarity between two already lowercased and stripped strings.
 
+        Scores that cannot reach cutoff are reported as 0.0 without running the
+        full SequenceMatcher comparison.
+        """
         # Exact match gets highest score
         if search_lower == alias_lower:
             return 1.0
@@ -43,8 +61,11 @@ class HeroFuzzySearch:
         elif alias_lower in search_lower:
             return 0.8
 
-        # Use sequence matcher for fuzzy matching
-        return SequenceMatcher(None, search_lower, alias_lower).ratio()
+        # Use sequence matcher for fuzzy matching, bailing out on its cheap upper bounds
+        matcher = SequenceMatcher(None, search_lower, alias_lower)
+        if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+            return 0.0
+        return matcher.ratio()
 
     def search_heroes(self, search_term: str, threshold: float = 0.6, max_results: int = 5) -> List[Dict]:
         """
@@ -61,24 +82,20 @@ class HeroFuzzySearch:
         if not search_term or not search_term.strip():
             return []
 
+        search_lower = search_term.lower().strip()
         matches = []
 
-        for hero_key, hero_data in self._fuzzy_data.items():
+        for hero_key, hero_data, names in self._search_index:
             best_score = 0.0
             matched_alias = ""
 
-            # Check hero name
-            name_score = self._calculate_similarity(search_term, hero_data['name'])
-            if name_score > best_score:
-                best_score = name_score
-                matched_alias = hero_data['name']
-
-            # Check all aliases
-            for alias in hero_data['aliases']:
-                alias_score = self._calculate_similarity(search_term, alias)
-                if alias_score > best_score:
-                    best_score = alias_score
-                    matched_alias = alias
+            # Check hero name, then all aliases; a name that can't beat both the
+            # threshold and the best score so far never changes the outcome
+            for name, name_lower in names:
+                score = self._score(search_lower, name_lower, max(threshold, best_score))
+                if score > best_score:
+                    best_score = score
+                    matched_alias = name
 
             # Add to matches if above threshold
             if best_score >= threshold:
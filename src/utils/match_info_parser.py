@@ -241,6 +241,13 @@ class MatchInfoParser:
             radiant_players = []
             dire_players = []
 
+            # Build name -> (hero_id, localized_name) once instead of scanning per player
+            heroes = constants_fetcher.get_heroes_constants()
+            hero_by_name = {
+                hdata.get("name"): (int(hid), hdata.get("localized_name"))
+                for hid, hdata in heroes.items()
+            }
+
             for p in game_info.players:
                 hero_name = p.hero_name
                 if hero_name.startswith("npc_dota_hero_"):
@@ -248,15 +255,8 @@ class MatchInfoParser:
                 else:
                     hero_internal = hero_name
 
-                _, hero_localized = self._get_hero_info(0)
-                heroes = constants_fetcher.get_heroes_constants()
-                for hid, hdata in heroes.items():
-                    if hdata.get("name") == p.hero_name:
-                        hero_localized = hdata.get("localized_name", hero_internal.replace("_", " ").title())
-                        hero_id = int(hid)
-                        break
-                else:
-                    hero_id = 0
+                hero_id, hero_localized = hero_by_name.get(p.hero_name, (0, None))
+                if not hero_localized:
                     hero_localized = hero_internal.replace("_", " ").title()
 
                 team = "radiant" if p.team == Team.RADIANT.value else "dire"
@@ -55,11 +55,31 @@ LANDMARKS = {
 }
 
 
+# Flattened tower table so nearest-tower search avoids dict iteration per call
+_TOWER_TABLE: Tuple[Tuple[str, float, float], ...] = tuple(
+    (name, float(pos[0]), float(pos[1])) for name, pos in TOWER_POSITIONS.items()
+)
+
+
 def _distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
     """Calculate distance between two points."""
     return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
 
 
+def _closest_tower(x: float, y: float) -> Tuple[Optional[str], float]:
+    """Find the nearest tower, comparing squared distances and taking one sqrt."""
+    closest_tower = None
+    min_sq = float('inf')
+    for name, tx, ty in _TOWER_TABLE:
+        dx = x - tx
+        dy = y - ty
+        d_sq = dx * dx + dy * dy
+        if d_sq < min_sq:
+            min_sq = d_sq
+            closest_tower = name
+    return closest_tower, math.sqrt(min_sq)
+
+
 def classify_map_position(x: float, y: float) -> MapPosition:
     """
     Classify a map position into a human-readable location.
@@ -71,13 +91,7 @@ def classify_map_position(x: float, y: float) -> MapPosition:
     Returns:
         MapPosition with region, lane, and nearby landmark info
     """
-    closest_tower = None
-    min_tower_dist = float('inf')
-    for name, pos in TOWER_POSITIONS.items():
-        d = _distance((x, y), pos)
-        if d < min_tower_dist:
-            min_tower_dist = d
-            closest_tower = name
+    closest_tower, min_tower_dist = _closest_tower(x, y)
 
     on_dire_side = y > x * 0.8 - 500
 
@@ -103,7 +103,7 @@ class ReplayDownloader:
 
             # Download with progress
             downloaded = 0
-            chunk_size = 8192
+            chunk_size = 65536  # 64KB chunks
 
             with open(bz2_file, 'wb') as f:
                 for chunk in response.iter_content(chunk_size=chunk_size):
@@ -113,7 +113,7 @@ class ReplayDownloader:
 
                         if total_size > 0:
                             progress = (downloaded / total_size) * 100
-                            if downloaded % (chunk_size * 100) == 0:  # Log every ~800KB
+                            if downloaded % (chunk_size * 100) == 0:  # Log every ~6.4MB
                                 logger.info(f"Download progress: {progress:.1f}%")
 
             logger.info(f"Successfully downloaded replay to {bz2_file}")
@@ -1,8 +1,11 @@
 """Fuzzy search utility for pro teams."""
 
+import heapq
 import logging
+from collections import Counter, defaultdict
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.models.pro_scene import SearchResult
 
@@ -15,6 +18,10 @@ class TeamFuzzySearch:
     def __init__(self):
         self._teams: List[Dict[str, Any]] = []
         self._aliases: Dict[str, List[str]] = {}
+        # (id, display name, [(searchable name, lowercased/stripped name, its character counts)])
+        self._index: List[Tuple[Any, str, List[Tuple[str, str, Counter]]]] = []
+        # normalized name -> [(index position, first name with that normalized form)]
+        self._exact: Dict[str, List[Tuple[int, str]]] = {}
         self._initialized = False
 
     def initialize(
@@ -23,6 +30,8 @@ class TeamFuzzySearch:
         """Initialize with team data and aliases."""
         self._teams = teams
         self._aliases = aliases
+        self._index = self._build_index()
+        self._exact = self._build_exact_index()
         self._initialized = True
         logger.info(
             f"Initialized team fuzzy search with {len(teams)} teams "
@@ -31,9 +40,23 @@ class TeamFuzzySearch:
 
     def _calculate_similarity(self, search_term: str, target: str) -> float:
         """Calculate similarity between search term and target string."""
-        search_lower = search_term.lower().strip()
-        target_lower = target.lower().strip()
+        return self._score(search_term.lower().strip(), target.lower().strip())
+
+    @staticmethod
+    def _score(
+        search_lower: str,
+        target_lower: str,
+        cutoff: float = 0.0,
+        search_chars: Optional[Counter] = None,
+        target_chars: Optional[Counter] = None,
+    ) -> float:
+        """
+        Similarity between two already lowercased and stripped strings.
 
+        Scores that cannot reach ``cutoff`` are reported as 0.0 without running
+        the full SequenceMatcher comparison. Passing precomputed character counts
+        lets that check run without building a SequenceMatcher at all.
+        """
         if search_lower == target_lower:
             return 1.0
 
@@ -42,7 +65,20 @@ class TeamFuzzySearch:
         elif target_lower in search_lower:
             return 0.8
 
-        return SequenceMatcher(None, search_lower, target_lower).ratio()
+        if search_chars is not None and target_chars is not None:
+            # Same bounds as real_quick_ratio() and quick_ratio(), computed the same way
+            length = len(search_lower) + len(target_lower)
+            if 2.0 * min(len(search_lower), len(target_lower)) / length < cutoff:
+                return 0.0
+            common = sum(min(count, target_chars[char]) for char, count in search_chars.items())
+            if 2.0 * common / length < cutoff:
+                return 0.0
+            return SequenceMatcher(None, search_lower, target_lower).ratio()
+
+        matcher = SequenceMatcher(None, search_lower, target_lower)
+        if matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff:
+            return 0.0
+        return matcher.ratio()
 
     def _get_searchable_names(self, team: Dict[str, Any]) -> List[str]:
         """Get all searchable names for a team."""
@@ -60,6 +96,33 @@ class TeamFuzzySearch:
 
         return names
 
+    def _build_index(self) -> List[Tuple[Any, str, List[Tuple[str, str, Counter]]]]:
+        """Normalize every searchable team name once so queries only score."""
+        index = []
+        for team in self._teams:
+            team_id = team.get("team_id")
+            if not team_id:
+                continue
+            display_name = team.get("name") or team.get("tag") or "Unknown"
+            names = []
+            for name in self._get_searchable_names(team):
+                if name:
+                    name_lower = name.lower().strip()
+                    names.append((name, name_lower, Counter(name_lower)))
+            index.append((team_id, display_name, names))
+        return index
+
+    def _build_exact_index(self) -> Dict[str, List[Tuple[int, str]]]:
+        """Map each normalized name to the teams it matches exactly."""
+        exact: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for position, (_, _, names) in enumerate(self._index):
+            seen = set()
+            for name, name_lower, _ in names:
+                if name_lower not in seen:
+                    seen.add(name_lower)
+                    exact[name_lower].append((position, name))
+        return dict(exact)
+
     def search(
         self, query: str, threshold: float = 0.6, max_results: int = 10
     ) -> List[SearchResult]:
@@ -81,39 +144,50 @@ class TeamFuzzySearch:
         if not query or not query.strip():
             return []
 
-        matches = []
-
-        for team in self._teams:
-            team_id = team.get("team_id")
-            if not team_id:
-                continue
+        query_lower = query.lower().strip()
+        query_chars = Counter(query_lower)
+
+        # Enough exact matches fill the result on their own: they all score
+        # 1.0 and keep index order under the stable sort below.
+        exact_hits = self._exact.get(query_lower, [])
+        if 0 < max_results <= len(exact_hits) and threshold <= 1.0:
+            results = []
+            for position, name in exact_hits[:max_results]:
+                entry_id, display_name, _ = self._index[position]
+                results.append(
+                    SearchResult.model_construct(id=entry_id, name=display_name, matched_alias=name, similarity=1.0)
+                )
+            return results
 
-            team_name = team.get("name") or team.get("tag") or "Unknown"
-            searchable_names = self._get_searchable_names(team)
+        matches = []
 
+        for team_id, team_name, names in self._index:
             best_score = 0.0
             matched_alias = ""
 
-            for name in searchable_names:
-                if not name:
-                    continue
-                score = self._calculate_similarity(query, name)
+            for name, name_lower, name_chars in names:
+                # Names that can't beat both the threshold and the best score so far
+                # never change the outcome, so let _score skip them early.
+                cutoff = max(threshold, best_score)
+                score = self._score(query_lower, name_lower, cutoff, query_chars, name_chars)
                 if score > best_score:
                     best_score = score
                     matched_alias = name
 
             if best_score >= threshold:
-                matches.append(
-                    SearchResult(
-                        id=team_id,
-                        name=team_name,
-                        matched_alias=matched_alias,
-                        similarity=best_score,
-                    )
-                )
-
-        matches.sort(key=lambda x: x.similarity, reverse=True)
-        return matches[:max_results]
+                matches.append((best_score, team_id, team_name, matched_alias))
+
+        # nlargest is a stable top-k, equivalent to sorting then slicing
+        if 0 < max_results < len(matches):
+            top = heapq.nlargest(max_results, matches, key=itemgetter(0))
+        else:
+            top = sorted(matches, key=itemgetter(0), reverse=True)[:max_results]
+
+        # Every field comes from the index built at initialize(), so skip validation
+        return [
+            SearchResult.model_construct(id=team_id, name=team_name, matched_alias=matched_alias, similarity=score)
+            for score, team_id, team_name, matched_alias in top
+        ]
 
     def find_best_match(
         self, query: str, threshold: float = 0.6
@@ -4,27 +4,81 @@ Timeline parser for extracting time-series data from Dota 2 replays.
 Uses v2 ParsedReplayData from ReplayService.
 """
 
+import bisect
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.services.models.replay_data import ParsedReplayData
 
 logger = logging.getLogger(__name__)
 
+TIMELINE_CACHE_SIZE = 16
+
+
+@dataclass(slots=True)
+class EntityTimelineRow:
+    """Per-minute hero entity sample (slotted, one per hero per snapshot)."""
+
+    game_time: float
+    minute: int
+    last_hits: int
+    denies: int
+    gold: int
+    level: int
+    hero_id: int
+
 
 class TimelineParser:
     """Parses replay files to extract timeline data using v2 ParsedReplayData."""
 
+    def __init__(self):
+        self._timeline_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        # id(timeline) -> (timeline, {minute: stats}); holding the timeline keeps its id from being reused
+        self._stats_cache: "OrderedDict[int, Tuple[Dict[str, Any], Dict[int, Dict[str, Any]]]]" = OrderedDict()
+
+    def _timeline_cache_key(self, data: ParsedReplayData) -> Optional[Tuple[Any, ...]]:
+        """Key a replay by path, mtime and size; None if the file can't be stat'ed."""
+        try:
+            st = os.stat(data.replay_path)
+        except (OSError, TypeError, ValueError):
+            return None
+        return (data.match_id, str(data.replay_path), st.st_mtime_ns, st.st_size)
+
     def parse_timeline(self, data: ParsedReplayData) -> Optional[Dict[str, Any]]:
         """
         Parse timeline data from parsed replay data.
 
+        Timelines are cached per replay file (LRU, keyed by path, mtime and
+        size), so repeated tool calls for the same match skip the rebuild.
+        Callers must treat the returned dict as read-only.
+
         Args:
             data: ParsedReplayData from ReplayService
 
         Returns:
             Dictionary with timeline data for all players, or None on error
         """
+        key = self._timeline_cache_key(data)
+        if key is not None:
+            cached = self._timeline_cache.get(key)
+            if cached is not None:
+                self._timeline_cache.move_to_end(key)
+                return cached
+
+        timeline = self._build_timeline(data)
+
+        if key is not None and timeline is not None:
+            self._timeline_cache[key] = timeline
+            if len(self._timeline_cache) > TIMELINE_CACHE_SIZE:
+                _, evicted = self._timeline_cache.popitem(last=False)
+                self._stats_cache.pop(id(evicted), None)
+        return timeline
+
+    def _build_timeline(self, data: ParsedReplayData) -> Optional[Dict[str, Any]]:
+        """Build timeline data for all players from parsed replay data."""
         if data.metadata is None:
             logger.error("No metadata found in replay")
             return None
@@ -63,21 +117,28 @@ class TimelineParser:
         if player_slot is None:
             return None
 
-        graph_nw = player.get('graph_net_worth', [])
-        graph_dmg = player.get('graph_hero_damage', [])
+        # Round once at ingestion so per-minute lookups can return values as-is
+        graph_nw = [round(v, 2) for v in player.get('graph_net_worth', [])]
+        graph_dmg = [round(v, 2) for v in player.get('graph_hero_damage', [])]
         snapshots = player.get('inventory_snapshot', [])
 
-        kda_timeline = []
+        # Column-oriented (one list per field) so lookups index by position;
+        # game_time holds seconds (float), the other columns are counts
+        kda_timeline: Dict[str, List[float]] = {
+            "game_time": [],
+            "kills": [],
+            "deaths": [],
+            "assists": [],
+            "level": [],
+        }
         for snap in snapshots:
             gt = snap.get('game_time', 0)
             if gt >= 0:
-                kda_timeline.append({
-                    "game_time": gt,
-                    "kills": snap.get('kills', 0),
-                    "deaths": snap.get('deaths', 0),
-                    "assists": snap.get('assists', 0),
-                    "level": snap.get('level', 1),
-                })
+                kda_timeline["game_time"].append(gt)
+                kda_timeline["kills"].append(snap.get('kills', 0))
+                kda_timeline["deaths"].append(snap.get('deaths', 0))
+                kda_timeline["assists"].append(snap.get('assists', 0))
+                kda_timeline["level"].append(snap.get('level', 1))
 
         return {
             "player_slot": player_slot,
@@ -104,47 +165,55 @@ class TimelineParser:
         """
         Merge entity data (last_hits, denies) into player timeline data.
 
+        Per-minute last hits and denies are read from the rows in
+        ``entity_timeline`` rather than duplicated into separate lists.
+
         Args:
             players: List of player timeline dicts to update in place
             entity_snapshots: Entity snapshots from v2 (python-manta EntitySnapshot)
         """
-        # Build player_id to timeline data mapping
-        player_timeline: Dict[int, List[Dict[str, Any]]] = {}
+        # Only aggregate heroes that map onto a timeline player
+        wanted_ids = {p.get('game_player_id') for p in players}
+        wanted_ids.discard(None)
+
+        # Build player_id -> (rows, minute column) in a single pass; both lists
+        # are handed to the player dicts by reference, not copied
+        player_timeline: Dict[int, Tuple[List[EntityTimelineRow], List[int]]] = {
+            pid: ([], []) for pid in wanted_ids
+        }
 
         for snap in entity_snapshots:
+            game_time = snap.game_time
             # Skip draft phase snapshots (game_time is 0.0 during draft)
-            if snap.game_time <= 0:
+            if game_time <= 0:
                 continue
 
-            game_min = int(snap.game_time / 60)
+            game_min = int(game_time) // 60
 
             # v2 uses snap.heroes instead of snap.players
             for hero in snap.heroes:
-                player_id = hero.player_id
-                if player_id is None:
+                columns = player_timeline.get(hero.player_id)
+                if columns is None:
                     continue
-
-                if player_id not in player_timeline:
-                    player_timeline[player_id] = []
-
-                player_timeline[player_id].append({
-                    "game_time": snap.game_time,
-                    "minute": game_min,
-                    "last_hits": hero.last_hits,
-                    "denies": hero.denies,
-                    "gold": hero.gold,
-                    "level": hero.level,
-                    "hero_id": getattr(hero, 'hero_id', 0),
-                })
+                rows, minutes = columns
+
+                # Positional construction skips keyword matching per row
+                rows.append(EntityTimelineRow(
+                    game_time,
+                    game_min,
+                    hero.last_hits,
+                    hero.denies,
+                    hero.gold,
+                    hero.level,
+                    getattr(hero, 'hero_id', 0),
+                ))
+                minutes.append(game_min)
 
         # Merge into players
         for player in players:
-            player_id = player.get('game_player_id')
-            if player_id is not None and player_id in player_timeline:
-                snapshots = player_timeline[player_id]
-                player['last_hits'] = [s['last_hits'] for s in snapshots]
-                player['denies'] = [s['denies'] for s in snapshots]
-                player['entity_timeline'] = snapshots
+            columns = player_timeline.get(player.get('game_player_id'))
+            if columns and columns[0]:
+                player['entity_timeline'], player['entity_minutes'] = columns
 
     def get_stats_at_minute(self, timeline: Dict[str, Any], minute: int) -> Dict[str, Any]:
         """
@@ -155,58 +224,76 @@ class TimelineParser:
             minute: Game minute to get stats for
 
         Returns:
-            Dictionary with per-player stats at that minute
+            Dictionary with per-player stats at that minute. Results are
+            memoized on the parser per timeline; each call returns a fresh
+            copy, and the timeline itself is never modified.
         """
+        entry = self._stats_cache.get(id(timeline))
+        if entry is None or entry[0] is not timeline:
+            entry = (timeline, {})
+            self._stats_cache[id(timeline)] = entry
+            if len(self._stats_cache) > TIMELINE_CACHE_SIZE:
+                self._stats_cache.popitem(last=False)
+        else:
+            self._stats_cache.move_to_end(id(timeline))
+        stats_cache = entry[1]
+
+        cached = stats_cache.get(minute)
+        if cached is not None:
+            return self._copy_stats(cached)
+
         graph_index = minute * 2
 
         player_stats = []
         for player in timeline.get('players', []):
             nw_list = player.get('net_worth', [])
             dmg_list = player.get('hero_damage', [])
-            kda = player.get('kda_timeline', [])
+            kda = player.get('kda_timeline') or {}
             entity_timeline = player.get('entity_timeline', [])
 
-            nw = nw_list[graph_index] if graph_index < len(nw_list) else nw_list[-1] if nw_list else 0
-            dmg = dmg_list[graph_index] if graph_index < len(dmg_list) else dmg_list[-1] if dmg_list else 0
+            # Clamp to the last sample instead of branching on the bound
+            nw = nw_list[min(graph_index, len(nw_list) - 1)] if nw_list else 0
+            dmg = dmg_list[min(graph_index, len(dmg_list) - 1)] if dmg_list else 0
 
-            kda_at_min = None
-            for entry in kda:
-                if entry.get('game_time', 0) <= minute * 60:
-                    kda_at_min = entry
-                else:
-                    break
+            kda_idx = bisect.bisect_right(kda.get('game_time', []), minute * 60) - 1
 
-            entity_at_min = None
-            for entry in entity_timeline:
-                if entry.get('minute', 0) <= minute:
-                    entity_at_min = entry
-                else:
-                    break
+            entity_minutes = player.get('entity_minutes')
+            if entity_minutes is None:
+                entity_minutes = [entry.minute for entry in entity_timeline]
+            entity_idx = bisect.bisect_right(entity_minutes, minute) - 1
+            entity_at_min = entity_timeline[entity_idx] if entity_idx >= 0 else None
 
             stat = {
                 "player_slot": player.get('player_slot'),
                 "team": player.get('team'),
-                "net_worth": round(nw, 2) if nw else 0,
-                "hero_damage": round(dmg, 2) if dmg else 0,
+                "net_worth": nw or 0,
+                "hero_damage": dmg or 0,
             }
-            if kda_at_min:
+            if kda_idx >= 0:
                 stat.update({
-                    "kills": kda_at_min.get('kills', 0),
-                    "deaths": kda_at_min.get('deaths', 0),
-                    "assists": kda_at_min.get('assists', 0),
-                    "level": kda_at_min.get('level', 1),
+                    "kills": kda['kills'][kda_idx],
+                    "deaths": kda['deaths'][kda_idx],
+                    "assists": kda['assists'][kda_idx],
+                    "level": kda['level'][kda_idx],
                 })
             if entity_at_min:
                 stat.update({
-                    "last_hits": entity_at_min.get('last_hits', 0),
-                    "denies": entity_at_min.get('denies', 0),
+                    "last_hits": entity_at_min.last_hits,
+                    "denies": entity_at_min.denies,
                 })
             player_stats.append(stat)
 
-        return {
+        result = {
             "minute": minute,
             "players": player_stats,
         }
+        stats_cache[minute] = result
+        return self._copy_stats(result)
+
+    @staticmethod
+    def _copy_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy memoized minute stats so callers can't corrupt the cache (values are scalars)."""
+        return {"minute": stats["minute"], "players": [dict(p) for p in stats["players"]]}
 
 
 timeline_parser = TimelineParser()
@@ -7,7 +7,7 @@ Uses v2 services exclusively. Parses replay data ONCE at session start.
 import asyncio
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import pytest
 
@@ -16,6 +16,7 @@ from src.services.combat.combat_service import CombatService
 from src.services.combat.fight_service import FightService
 from src.services.models.replay_data import ParsedReplayData
 from src.services.replay.replay_service import ReplayService
+from src.utils.timeline_parser import TimelineParser
 
 
 def _get_replay_dir() -> Path:
@@ -60,6 +61,7 @@ _parsed_data_2: Optional[ParsedReplayData] = None  # Match 2
 _replay_service: Optional[ReplayService] = None
 _combat_service: Optional[CombatService] = None
 _fight_service: Optional[FightService] = None
+_timeline_parser: Optional[TimelineParser] = None
 _cache = {}
 
 
@@ -88,58 +90,67 @@ def _get_replay_service() -> ReplayService:
     return _replay_service
 
 
-def _get_parsed_data() -> ParsedReplayData:
-    """Get parsed replay data, parsing once if needed."""
-    global _parsed_data
-    if _parsed_data is not None:
-        return _parsed_data
-
-    if not REPLAY_PATH.exists():
-        raise FileNotFoundError(f"Replay file not found: {REPLAY_PATH}")
-
-    print(f"\n[conftest] Loading replay {TEST_MATCH_ID} via v2 ReplayService...")
-    rs = _get_replay_service()
+def _run_coroutine(coro):
+    """Run a coroutine to completion, even from inside a running event loop."""
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
         loop = None
 
     if loop and loop.is_running():
-        # If we're already in an async context, create a new thread
+        # If we're already in an async context, run it on a new thread
         import concurrent.futures
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, rs.get_parsed_data(TEST_MATCH_ID))
-            _parsed_data = future.result()
-    else:
-        _parsed_data = asyncio.run(rs.get_parsed_data(TEST_MATCH_ID))
-    print(f"[conftest] Loaded {len(_parsed_data.combat_log_entries)} combat log entries")
-    return _parsed_data
+            return executor.submit(asyncio.run, coro).result()
+    return asyncio.run(coro)
 
 
-def _get_parsed_data_2() -> ParsedReplayData:
-    """Get parsed replay data for match 2, parsing once if needed."""
-    global _parsed_data_2
-    if _parsed_data_2 is not None:
-        return _parsed_data_2
-
-    if not REPLAY_PATH_2.exists():
-        raise FileNotFoundError(f"Replay file not found: {REPLAY_PATH_2}")
+async def _gather_parsed_data(match_ids: List[int]) -> List[ParsedReplayData]:
+    """Load several replays concurrently, each in its own worker thread.
 
-    print(f"\n[conftest] Loading replay {TEST_MATCH_ID_2} via v2 ReplayService...")
+    ReplayService.get_parsed_data parses synchronously inside the coroutine,
+    so every load gets its own thread and event loop to actually overlap.
+    """
     rs = _get_replay_service()
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
+    return await asyncio.gather(
+        *(asyncio.to_thread(asyncio.run, rs.get_parsed_data(match_id)) for match_id in match_ids)
+    )
 
-    if loop and loop.is_running():
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, rs.get_parsed_data(TEST_MATCH_ID_2))
-            _parsed_data_2 = future.result()
-    else:
-        _parsed_data_2 = asyncio.run(rs.get_parsed_data(TEST_MATCH_ID_2))
-    print(f"[conftest] Loaded {len(_parsed_data_2.combat_log_entries)} combat log entries for match 2")
+
+def _preload_parsed_data() -> None:
+    """Load every available test replay that is not loaded yet in one gather."""
+    global _parsed_data, _parsed_data_2
+    pending = []
+    if _parsed_data is None and REPLAY_PATH.exists():
+        pending.append(TEST_MATCH_ID)
+    if _parsed_data_2 is None and REPLAY_PATH_2.exists():
+        pending.append(TEST_MATCH_ID_2)
+    if not pending:
+        return
+
+    print(f"\n[conftest] Loading replays {pending} via v2 ReplayService...")
+    loaded = dict(zip(pending, _run_coroutine(_gather_parsed_data(pending))))
+    for match_id, data in loaded.items():
+        print(f"[conftest] Loaded {len(data.combat_log_entries)} combat log entries for {match_id}")
+    _parsed_data = loaded.get(TEST_MATCH_ID, _parsed_data)
+    _parsed_data_2 = loaded.get(TEST_MATCH_ID_2, _parsed_data_2)
+
+
+def _get_parsed_data() -> ParsedReplayData:
+    """Get parsed replay data, parsing once if needed."""
+    if _parsed_data is None:
+        if not REPLAY_PATH.exists():
+            raise FileNotFoundError(f"Replay file not found: {REPLAY_PATH}")
+        _preload_parsed_data()
+    return _parsed_data
+
+
+def _get_parsed_data_2() -> ParsedReplayData:
+    """Get parsed replay data for match 2, parsing once if needed."""
+    if _parsed_data_2 is None:
+        if not REPLAY_PATH_2.exists():
+            raise FileNotFoundError(f"Replay file not found: {REPLAY_PATH_2}")
+        _preload_parsed_data()
     return _parsed_data_2
 
 
@@ -159,97 +170,121 @@ def _get_fight_service() -> FightService:
     return _fight_service
 
 
-def _ensure_parsed():
-    """Parse all data once and cache it using v2 services."""
-    if _cache:
-        return  # Already parsed
+def _get_timeline_parser() -> TimelineParser:
+    """Get or create TimelineParser singleton."""
+    global _timeline_parser
+    if _timeline_parser is None:
+        _timeline_parser = TimelineParser()
+    return _timeline_parser
 
-    data = _get_parsed_data()  # Raises FileNotFoundError if not available
 
-    combat = _get_combat_service()
-    fight = _get_fight_service()
+def _combat_log(**kwargs) -> Callable[[ParsedReplayData], Any]:
+    """Build an extractor for a combat log slice with the given filters."""
+    return lambda data: _get_combat_service().get_combat_log(data, **kwargs)
 
-    print("[conftest] Extracting data via v2 services...")
 
-    # Hero deaths
-    _cache["deaths"] = combat.get_hero_deaths(data)
+def _index_by(items: List[Any], attr: str) -> Dict[Any, List[Any]]:
+    """Group items by an attribute value so tests look up instead of scanning."""
+    index: Dict[Any, List[Any]] = {}
+    for item in items:
+        index.setdefault(getattr(item, attr), []).append(item)
+    return index
 
-    # Objectives
-    _cache["roshan"] = combat.get_roshan_kills(data)
-    _cache["tormentor"] = combat.get_tormentor_kills(data)
-    _cache["towers"] = combat.get_tower_kills(data)
-    _cache["barracks"] = combat.get_barracks_kills(data)
 
+def _collect_fight_highlights(data: ParsedReplayData) -> Dict[str, Any]:
+    """Collect highlights across all fights, plus per-hero/team indices."""
+    fs = _get_fight_service()
+    highlights: Dict[str, Any] = {
+        "multi_hero_abilities": [],
+        "kill_streaks": [],
+        "bkb_blink_combos": [],
+        "coordinated_ults": [],
+        "clutch_saves": [],
+    }
+    reference_times = [fight.start_time for fight in _cached("fights").fights]
+    for context in fs.get_all_fight_combat_logs(data, reference_times):
+        if context and "highlights" in context:
+            hl = context["highlights"]
+            highlights["multi_hero_abilities"].extend(hl.multi_hero_abilities)
+            highlights["kill_streaks"].extend(hl.kill_streaks)
+            highlights["bkb_blink_combos"].extend(hl.bkb_blink_combos)
+            highlights["coordinated_ults"].extend(hl.coordinated_ults)
+            highlights["clutch_saves"].extend(hl.clutch_saves)
+
+    highlights["multi_hero_abilities_by_caster"] = _index_by(highlights["multi_hero_abilities"], "caster")
+    highlights["kill_streaks_by_hero"] = _index_by(highlights["kill_streaks"], "hero")
+    highlights["bkb_blink_combos_by_hero"] = _index_by(highlights["bkb_blink_combos"], "hero")
+    highlights["coordinated_ults_by_team"] = _index_by(highlights["coordinated_ults"], "team")
+    highlights["clutch_saves_by_saved_hero"] = _index_by(highlights["clutch_saves"], "saved_hero")
+    highlights["clutch_saves_by_saver"] = _index_by(highlights["clutch_saves"], "saver")
+    return highlights
+
+
+# Extractors keyed by cache entry. Each one runs at most once per session,
+# on first use, so a partial test run only pays for the data it touches.
+_EXTRACTORS: Dict[str, Callable[[ParsedReplayData], Any]] = {
+    # Hero deaths
+    "deaths": lambda data: _get_combat_service().get_hero_deaths(data),
+    # Objectives
+    "roshan": lambda data: _get_combat_service().get_roshan_kills(data),
+    "tormentor": lambda data: _get_combat_service().get_tormentor_kills(data),
+    "towers": lambda data: _get_combat_service().get_tower_kills(data),
+    "barracks": lambda data: _get_combat_service().get_barracks_kills(data),
     # Rune pickups
-    _cache["rune_pickups"] = combat.get_rune_pickups(data)
-
+    "rune_pickups": lambda data: _get_combat_service().get_rune_pickups(data),
     # Combat log segments
-    _cache["combat_log_280_290"] = combat.get_combat_log(
-        data, start_time=280, end_time=290
-    )
-    _cache["combat_log_280_290_es"] = combat.get_combat_log(
-        data, start_time=280, end_time=290, hero_filter="earthshaker"
-    )
-    _cache["combat_log_287_289_es"] = combat.get_combat_log(
-        data, start_time=287, end_time=289, hero_filter="earthshaker"
-    )
-    _cache["combat_log_280_300_ability"] = combat.get_combat_log(
-        data, start_time=280, end_time=300, types=[5]
-    )
-    _cache["combat_log_280_300_es_ability"] = combat.get_combat_log(
-        data, start_time=280, end_time=300, types=[5], hero_filter="earthshaker"
-    )
-    _cache["combat_log_280_282_naga_ability"] = combat.get_combat_log(
-        data, start_time=280, end_time=282, types=[5], hero_filter="naga"
-    )
-    _cache["combat_log_280_290_dmg_mod_death"] = combat.get_combat_log(
-        data, start_time=280, end_time=290, types=[0, 2, 4]
-    )
-    _cache["combat_log_0_600_ability"] = combat.get_combat_log(
-        data, start_time=0, end_time=600, types=[5]
-    )
-    _cache["combat_log_320_370"] = combat.get_combat_log(
-        data, start_time=320, end_time=370
-    )
-    _cache["combat_log_360_370"] = combat.get_combat_log(
-        data, start_time=360, end_time=370
-    )
-    _cache["combat_log_trigger_only"] = combat.get_combat_log(
-        data, types=[13]
-    )
-    _cache["combat_log_280_290_narrative"] = combat.get_combat_log(
-        data, start_time=280, end_time=290, detail_level=DetailLevel.NARRATIVE
-    )
-    _cache["combat_log_280_290_tactical"] = combat.get_combat_log(
-        data, start_time=280, end_time=290, detail_level=DetailLevel.TACTICAL
-    )
-    _cache["combat_log_280_290_full"] = combat.get_combat_log(
-        data, start_time=280, end_time=290, detail_level=DetailLevel.FULL
-    )
+    "combat_log_280_290": _combat_log(start_time=280, end_time=290),
+    "combat_log_280_290_es": _combat_log(start_time=280, end_time=290, hero_filter="earthshaker"),
+    "combat_log_287_289_es": _combat_log(start_time=287, end_time=289, hero_filter="earthshaker"),
+    "combat_log_280_300_ability": _combat_log(start_time=280, end_time=300, types=[5]),
+    "combat_log_280_300_es_ability": _combat_log(
+        start_time=280, end_time=300, types=[5], hero_filter="earthshaker"
+    ),
+    "combat_log_280_282_naga_ability": _combat_log(
+        start_time=280, end_time=282, types=[5], hero_filter="naga"
+    ),
+    "combat_log_280_290_dmg_mod_death": _combat_log(start_time=280, end_time=290, types=[0, 2, 4]),
+    "combat_log_0_600_ability": _combat_log(start_time=0, end_time=600, types=[5]),
+    "combat_log_320_370": _combat_log(start_time=320, end_time=370),
+    "combat_log_360_370": _combat_log(start_time=360, end_time=370),
+    "combat_log_trigger_only": _combat_log(types=[13]),
+    "combat_log_280_290_narrative": _combat_log(
+        start_time=280, end_time=290, detail_level=DetailLevel.NARRATIVE
+    ),
+    "combat_log_280_290_tactical": _combat_log(
+        start_time=280, end_time=290, detail_level=DetailLevel.TACTICAL
+    ),
+    "combat_log_280_290_full": _combat_log(start_time=280, end_time=290, detail_level=DetailLevel.FULL),
     # Pre-game time filter tests (purchases happen at negative times)
-    _cache["combat_log_start_time_0"] = combat.get_combat_log(
-        data, start_time=0, end_time=120, detail_level=DetailLevel.NARRATIVE
-    )
-    _cache["combat_log_start_time_neg90"] = combat.get_combat_log(
-        data, start_time=-90, end_time=120, detail_level=DetailLevel.NARRATIVE
-    )
-    _cache["combat_log_start_time_none"] = combat.get_combat_log(
-        data, start_time=None, end_time=120, detail_level=DetailLevel.NARRATIVE
-    )
-
+    "combat_log_start_time_0": _combat_log(start_time=0, end_time=120, detail_level=DetailLevel.NARRATIVE),
+    "combat_log_start_time_neg90": _combat_log(
+        start_time=-90, end_time=120, detail_level=DetailLevel.NARRATIVE
+    ),
+    "combat_log_start_time_none": _combat_log(
+        start_time=None, end_time=120, detail_level=DetailLevel.NARRATIVE
+    ),
     # Fight detections using FightService
-    _cache["fights"] = fight.get_all_fights(data)
-    _cache["fight_first_blood"] = fight.get_fight_at_time(
+    "fights": lambda data: _get_fight_service().get_all_fights(data),
+    "fight_first_blood": lambda data: _get_fight_service().get_fight_at_time(
         data, reference_time=FIRST_BLOOD_TIME, hero="earthshaker"
-    )
-    _cache["fight_first_blood_no_hero"] = fight.get_fight_at_time(
+    ),
+    "fight_first_blood_no_hero": lambda data: _get_fight_service().get_fight_at_time(
         data, reference_time=FIRST_BLOOD_TIME, hero=None
-    )
-    _cache["fight_pango_nf"] = fight.get_fight_at_time(
+    ),
+    "fight_pango_nf": lambda data: _get_fight_service().get_fight_at_time(
         data, reference_time=268, hero="pangolier"
-    )
+    ),
+    "fight_highlights": _collect_fight_highlights,
+    # Timeline (None when the replay has no metadata)
+    "timeline": lambda data: _get_timeline_parser().parse_timeline(data),
+}
+
 
-    print("[conftest] v2 data extraction complete!")
+def _cached(key: str) -> Any:
+    """Return the cached extraction for key, computing it on first use."""
+    if key not in _cache:
+        _cache[key] = _EXTRACTORS[key](_get_parsed_data())
+    return _cache[key]
 
 
 # =============================================================================
@@ -285,181 +320,213 @@ def parsed_replay_data():
 
 def _require_replay():
     """Fail if replay is not available."""
-    if not REPLAY_PATH.exists():
+    # Once the replay is loaded the file check is moot; skip the stat() per fixture
+    if _parsed_data is None and not REPLAY_PATH.exists():
         raise FileNotFoundError(f"Replay file not found: {REPLAY_PATH}")
 
 
+@pytest.fixture(scope="session")
+def combat_service() -> CombatService:
+    """Shared CombatService instance."""
+    return _get_combat_service()
+
+
+@pytest.fixture(scope="session")
+def fight_service() -> FightService:
+    """Shared FightService instance."""
+    return _get_fight_service()
+
+
 @pytest.fixture(scope="session")
 def hero_deaths():
     """Cached hero deaths."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("deaths", [])
+    return _cached("deaths")
 
 
 @pytest.fixture(scope="session")
 def hero_deaths_with_position():
     """Cached hero deaths (same as hero_deaths, positions included in v2)."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("deaths", [])
+    return _cached("deaths")
 
 
 @pytest.fixture(scope="session")
-def objectives():
-    """Cached objective kills as tuple (roshan, tormentor, towers, barracks)."""
+def roshan_kills():
+    """Cached Roshan kills."""
     _require_replay()
-    _ensure_parsed()
-    return (
-        _cache.get("roshan", []),
-        _cache.get("tormentor", []),
-        _cache.get("towers", []),
-        _cache.get("barracks", []),
-    )
+    return _cached("roshan")
+
+
+@pytest.fixture(scope="session")
+def tormentor_kills():
+    """Cached Tormentor kills."""
+    _require_replay()
+    return _cached("tormentor")
+
+
+@pytest.fixture(scope="session")
+def tower_kills():
+    """Cached tower kills."""
+    _require_replay()
+    return _cached("towers")
+
+
+@pytest.fixture(scope="session")
+def barracks_kills():
+    """Cached barracks kills."""
+    _require_replay()
+    return _cached("barracks")
+
+
+@pytest.fixture(scope="session")
+def objectives(roshan_kills, tormentor_kills, tower_kills, barracks_kills):
+    """Cached objective kills as tuple (roshan, tormentor, towers, barracks)."""
+    return (roshan_kills, tormentor_kills, tower_kills, barracks_kills)
 
 
 @pytest.fixture(scope="session")
 def rune_pickups():
     """Cached rune pickups."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("rune_pickups", [])
+    return _cached("rune_pickups")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_290():
     """Combat log from 280-290s (first blood area)."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_290", [])
+    return _cached("combat_log_280_290")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_290_earthshaker():
     """Combat log 280-290s filtered to earthshaker."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_290_es", [])
+    return _cached("combat_log_280_290_es")
 
 
 @pytest.fixture(scope="session")
 def combat_log_287_289_earthshaker():
     """Combat log 287-289s filtered to earthshaker."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_287_289_es", [])
+    return _cached("combat_log_287_289_es")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_300_ability():
     """Combat log 280-300s, ABILITY events only."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_300_ability", [])
+    return _cached("combat_log_280_300_ability")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_300_earthshaker_ability():
     """Combat log 280-300s, ABILITY events, earthshaker filter."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_300_es_ability", [])
+    return _cached("combat_log_280_300_es_ability")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_282_naga_ability():
     """Combat log 280-282s, ABILITY events, naga filter."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_282_naga_ability", [])
+    return _cached("combat_log_280_282_naga_ability")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_290_non_ability():
     """Combat log 280-290s, DAMAGE/MODIFIER_ADD/DEATH only."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_290_dmg_mod_death", [])
+    return _cached("combat_log_280_290_dmg_mod_death")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_290_narrative():
     """Combat log 280-290s with detail_level=NARRATIVE."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_290_narrative", [])
+    return _cached("combat_log_280_290_narrative")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_290_tactical():
     """Combat log 280-290s with detail_level=TACTICAL."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_290_tactical", [])
+    return _cached("combat_log_280_290_tactical")
 
 
 @pytest.fixture(scope="session")
 def combat_log_280_290_full():
     """Combat log 280-290s with detail_level=FULL."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_280_290_full", [])
+    return _cached("combat_log_280_290_full")
+
+
+@pytest.fixture(scope="session")
+def combat_log_280_290_narrative_by_type(combat_log_280_290_narrative):
+    """NARRATIVE 280-290s events grouped by event type."""
+    return _index_by(combat_log_280_290_narrative, "type")
+
+
+@pytest.fixture(scope="session")
+def combat_log_280_290_tactical_by_type(combat_log_280_290_tactical):
+    """TACTICAL 280-290s events grouped by event type."""
+    return _index_by(combat_log_280_290_tactical, "type")
+
+
+@pytest.fixture(scope="session")
+def combat_log_280_290_full_by_type(combat_log_280_290_full):
+    """FULL 280-290s events grouped by event type."""
+    return _index_by(combat_log_280_290_full, "type")
 
 
 @pytest.fixture(scope="session")
 def combat_log_0_600_ability():
     """Combat log 0-600s, ABILITY events only."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_0_600_ability", [])
+    return _cached("combat_log_0_600_ability")
 
 
 @pytest.fixture(scope="session")
 def combat_log_320_370():
     """Combat log 320-370s."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_320_370", [])
+    return _cached("combat_log_320_370")
 
 
 @pytest.fixture(scope="session")
 def combat_log_360_370():
     """Combat log 360-370s."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_360_370", [])
+    return _cached("combat_log_360_370")
 
 
 @pytest.fixture(scope="session")
 def combat_log_trigger_only():
     """Combat log ABILITY_TRIGGER events only."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_trigger_only", [])
+    return _cached("combat_log_trigger_only")
 
 
 @pytest.fixture(scope="session")
 def combat_log_start_time_0():
     """Combat log with start_time=0 (excludes pre-game)."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_start_time_0", [])
+    return _cached("combat_log_start_time_0")
 
 
 @pytest.fixture(scope="session")
 def combat_log_start_time_neg90():
     """Combat log with start_time=-90 (includes pre-game)."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_start_time_neg90", [])
+    return _cached("combat_log_start_time_neg90")
 
 
 @pytest.fixture(scope="session")
 def combat_log_start_time_none():
     """Combat log with start_time=None (includes all events)."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("combat_log_start_time_none", [])
+    return _cached("combat_log_start_time_none")
 
 
 # =============================================================================
@@ -470,32 +537,35 @@ def combat_log_start_time_none():
 def fight_first_blood():
     """Fight detection result for first blood (earthshaker anchor)."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("fight_first_blood")
+    return _cached("fight_first_blood")
 
 
 @pytest.fixture(scope="session")
 def fight_first_blood_no_hero():
     """Fight detection for first blood without hero anchor."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("fight_first_blood_no_hero")
+    return _cached("fight_first_blood_no_hero")
 
 
 @pytest.fixture(scope="session")
 def fight_pango_nevermore():
     """Fight detection for pangolier vs nevermore."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("fight_pango_nf")
+    return _cached("fight_pango_nf")
 
 
 @pytest.fixture(scope="session")
 def all_fights():
     """All fights detected in the match."""
     _require_replay()
-    _ensure_parsed()
-    return _cache.get("fights")
+    return _cached("fights")
+
+
+@pytest.fixture(scope="session")
+def all_highlights():
+    """Highlights from every fight in the match, with per-hero/team indices."""
+    _require_replay()
+    return _cached("fight_highlights")
 
 
 # =============================================================================
@@ -506,7 +576,6 @@ def all_fights():
 def fight_4640_combat_log():
     """Combat log from fight at 46:40 (2780-2820s)."""
     _require_replay()
-    _ensure_parsed()
     if "fight_4640_combat_log" not in _cache:
         data = _get_parsed_data()
         combat = _get_combat_service()
@@ -521,7 +590,6 @@ def fight_4640_combat_log():
 def fight_4640_deaths():
     """Hero deaths from fight at 46:40."""
     _require_replay()
-    _ensure_parsed()
     if "fight_4640_deaths" not in _cache:
         data = _get_parsed_data()
         combat = _get_combat_service()
@@ -538,13 +606,12 @@ def fight_4640_deaths():
 def team_heroes():
     """Team hero assignments extracted from entity snapshots."""
     _require_replay()
-    _ensure_parsed()
     if "team_heroes" not in _cache:
         data = _get_parsed_data()
         fight = _get_fight_service()
         radiant, dire = fight._get_team_heroes(data)
         _cache["team_heroes"] = (radiant, dire)
-    return _cache.get("team_heroes", (set(), set()))
+    return _cache.get("team_heroes", (frozenset(), frozenset()))
 
 
 # =============================================================================
@@ -555,7 +622,6 @@ def team_heroes():
 def hero_combat_analysis_earthshaker():
     """Hero combat analysis for earthshaker."""
     _require_replay()
-    _ensure_parsed()
     cache_key = "hero_combat_analysis_earthshaker"
     if cache_key not in _cache:
         data = _get_parsed_data()
@@ -572,7 +638,6 @@ def hero_combat_analysis_earthshaker():
 def hero_combat_analysis_disruptor():
     """Hero combat analysis for disruptor."""
     _require_replay()
-    _ensure_parsed()
     cache_key = "hero_combat_analysis_disruptor"
     if cache_key not in _cache:
         data = _get_parsed_data()
@@ -585,6 +650,18 @@ def hero_combat_analysis_disruptor():
     return _cache.get(cache_key)
 
 
+@pytest.fixture(scope="session")
+def earthshaker_ability_index(hero_combat_analysis_earthshaker):
+    """Earthshaker's ability summary keyed by lowercased ability name."""
+    return {a.ability.lower(): a for a in hero_combat_analysis_earthshaker.ability_summary}
+
+
+@pytest.fixture(scope="session")
+def disruptor_ability_index(hero_combat_analysis_disruptor):
+    """Disruptor's ability summary keyed by lowercased ability name."""
+    return {a.ability.lower(): a for a in hero_combat_analysis_disruptor.ability_summary}
+
+
 # =============================================================================
 # Farming Service fixtures
 # =============================================================================
@@ -627,7 +704,6 @@ def lane_service():
 def medusa_farming_pattern():
     """Farming pattern for Medusa (0-15 min) from match 8461956309."""
     _require_replay()
-    _ensure_parsed()
     cache_key = "medusa_farming_0_15"
     if cache_key not in _cache:
         data = _get_parsed_data()
@@ -642,7 +718,6 @@ def medusa_farming_pattern():
 def juggernaut_farming_pattern():
     """Farming pattern for Juggernaut (0-15 min) from match 8461956309."""
     _require_replay()
-    _ensure_parsed()
     cache_key = "juggernaut_farming_0_15"
     if cache_key not in _cache:
         data = _get_parsed_data()
@@ -657,7 +732,6 @@ def juggernaut_farming_pattern():
 def lane_summary():
     """Lane summary for match 8461956309."""
     _require_replay()
-    _ensure_parsed()
     cache_key = "lane_summary"
     if cache_key not in _cache:
         data = _get_parsed_data()
@@ -670,7 +744,6 @@ def lane_summary():
 def cs_at_10_minutes():
     """CS data at 10 minutes for match 8461956309."""
     _require_replay()
-    _ensure_parsed()
     cache_key = "cs_at_10"
     if cache_key not in _cache:
         data = _get_parsed_data()
@@ -683,17 +756,13 @@ def cs_at_10_minutes():
 # Match Fetcher fixtures (OpenDota API data)
 # =============================================================================
 
-_match_fetcher = None
 _match_players_cache = None
 
 
 def _get_match_fetcher():
-    """Get or create MatchFetcher singleton."""
-    global _match_fetcher
-    if _match_fetcher is None:
-        from src.utils.match_fetcher import MatchFetcher
-        _match_fetcher = MatchFetcher()
-    return _match_fetcher
+    """Get the shared module-level MatchFetcher."""
+    from src.utils.match_fetcher import match_fetcher
+    return match_fetcher
 
 
 @pytest.fixture(scope="session")
@@ -715,7 +784,7 @@ _match_2_players_cache = None
 
 def _require_replay_2():
     """Fail if replay 2 is not available."""
-    if not REPLAY_PATH_2.exists():
+    if _parsed_data_2 is None and not REPLAY_PATH_2.exists():
         raise FileNotFoundError(f"Replay file not found: {REPLAY_PATH_2}")
 
 
@@ -855,10 +924,10 @@ def item_purchases_2(parsed_replay_data_2):
 
 
 @pytest.fixture(scope="session")
-def item_purchases_juggernaut_2(parsed_replay_data_2):
+def item_purchases_juggernaut_2(item_purchases_2):
     """Item purchases for Juggernaut from match 8594217096."""
-    cs = _get_combat_service()
-    return cs.get_item_purchases(parsed_replay_data_2, hero_filter="juggernaut")
+    # Same substring match as get_item_purchases(hero_filter=...), without rescanning the log
+    return [p for p in item_purchases_2 if "juggernaut" in p.hero.lower()]
 
 
 @pytest.fixture(scope="session")
@@ -904,6 +973,23 @@ def hero_combat_analysis_centaur_2(parsed_replay_data_2, all_fights_2):
     )
 
 
+# =============================================================================
+# Timeline fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def timeline_parser() -> TimelineParser:
+    """Shared TimelineParser instance."""
+    return _get_timeline_parser()
+
+
+@pytest.fixture(scope="session")
+def timeline():
+    """Cached timeline parsed from the replay metadata."""
+    _require_replay()
+    return _cached("timeline")
+
+
 # =============================================================================
 # Pro Scene fixtures (real data from OpenDota)
 # =============================================================================
@@ -8,8 +8,18 @@ Uses pre-parsed replay data from conftest.py fixtures.
 Run with: uv run pytest tests/test_use_cases.py -v
 """
 
+from dataclasses import fields
+
 import pytest
 
+from src.models.combat_log import HeroDeath
+from src.resources.heroes_resources import heroes_resource
+from src.resources.map_resources import get_cached_map_data
+from src.services import CombatService, ReplayService
+from src.services.models.combat_data import ObjectiveKill
+from src.utils.constants_fetcher import constants_fetcher
+from src.utils.hero_fuzzy_search import hero_fuzzy_search
+
 
 class TestUseCaseAnalyzeTeamfight:
     """
@@ -23,14 +33,14 @@ class TestUseCaseAnalyzeTeamfight:
     def test_get_hero_deaths_returns_deaths_with_time(self, hero_deaths):
         """Deaths have game_time for identifying fight moments."""
         assert len(hero_deaths) > 0
-        assert all(hasattr(d, 'game_time') for d in hero_deaths)
-        assert all(hasattr(d, 'game_time_str') for d in hero_deaths)
+        assert all(isinstance(d, HeroDeath) for d in hero_deaths)
+        assert {'game_time', 'game_time_str'} <= HeroDeath.model_fields.keys()
 
     @pytest.mark.use_case
     def test_get_hero_deaths_has_killer_and_victim(self, hero_deaths):
         """Deaths identify killer and victim for fight analysis."""
-        assert all(hasattr(d, 'killer') for d in hero_deaths)
-        assert all(hasattr(d, 'victim') for d in hero_deaths)
+        assert all(isinstance(d, HeroDeath) for d in hero_deaths)
+        assert {'killer', 'victim'} <= HeroDeath.model_fields.keys()
         assert all(d.victim for d in hero_deaths)
 
     @pytest.mark.use_case
@@ -56,10 +66,9 @@ class TestUseCaseUnderstandGank:
     def test_hero_deaths_include_position(self, hero_deaths_with_position):
         """Deaths include position data for gank analysis."""
         # v2: position_x and position_y directly on HeroDeath, not nested .position
-        deaths_with_pos = [d for d in hero_deaths_with_position if d.position_x is not None]
-        assert len(deaths_with_pos) > 0
-        assert deaths_with_pos[0].position_x is not None
-        assert deaths_with_pos[0].position_y is not None
+        first_with_pos = next((d for d in hero_deaths_with_position if d.position_x is not None), None)
+        assert first_with_pos is not None
+        assert first_with_pos.position_y is not None
 
     @pytest.mark.use_case
     def test_fight_has_deaths(self, fight_first_blood):
@@ -77,26 +86,23 @@ class TestUseCaseObjectiveControl:
     """
 
     @pytest.mark.use_case
-    def test_objective_kills_has_roshan(self, objectives):
+    def test_objective_kills_has_roshan(self, roshan_kills):
         """Roshan kills are tracked with timing."""
-        roshan, _, _, _ = objectives
-        assert len(roshan) > 0
-        assert all(hasattr(r, 'game_time') for r in roshan)
-        assert all(hasattr(r, 'killer') for r in roshan)
+        assert len(roshan_kills) > 0
+        assert all(isinstance(r, ObjectiveKill) for r in roshan_kills)
+        assert {'game_time', 'killer'} <= {f.name for f in fields(ObjectiveKill)}
 
     @pytest.mark.use_case
-    def test_objective_kills_has_towers(self, objectives):
+    def test_objective_kills_has_towers(self, tower_kills):
         """Tower kills are tracked."""
-        _, _, towers, _ = objectives
-        assert len(towers) > 0
-        for t in towers:
-            assert hasattr(t, 'team')
+        assert len(tower_kills) > 0
+        assert all(isinstance(t, ObjectiveKill) for t in tower_kills)
+        assert 'team' in {f.name for f in fields(ObjectiveKill)}
 
     @pytest.mark.use_case
-    def test_objective_kills_has_barracks(self, objectives):
+    def test_objective_kills_has_barracks(self, barracks_kills):
         """Barracks kills are tracked."""
-        _, _, _, barracks = objectives
-        assert isinstance(barracks, list)
+        assert isinstance(barracks_kills, list)
 
 
 class TestFastUnitTests:
@@ -107,8 +113,6 @@ class TestFastUnitTests:
     @pytest.mark.asyncio
     async def test_heroes_resource_loads(self):
         """Heroes resource loads without replay."""
-        from src.resources.heroes_resources import heroes_resource
-
         heroes = await heroes_resource.get_all_heroes()
         assert len(heroes) > 100
 
@@ -116,8 +120,6 @@ class TestFastUnitTests:
     @pytest.mark.core
     def test_map_resource_loads(self):
         """Map resource loads without replay."""
-        from src.resources.map_resources import get_cached_map_data
-
         map_data = get_cached_map_data()
         assert map_data.towers
         assert map_data.neutral_camps
@@ -127,8 +129,6 @@ class TestFastUnitTests:
     @pytest.mark.core
     def test_constants_fetcher_works(self):
         """Constants fetcher provides hero data."""
-        from src.utils.constants_fetcher import constants_fetcher
-
         heroes = constants_fetcher.get_heroes_constants()
         assert heroes is not None
         assert len(heroes) > 100
@@ -137,8 +137,6 @@ class TestFastUnitTests:
     @pytest.mark.core
     def test_hero_fuzzy_search_works(self):
         """Fuzzy search finds heroes."""
-        from src.utils.hero_fuzzy_search import hero_fuzzy_search
-
         result = hero_fuzzy_search.find_best_match("jugg")
         assert result is not None
         assert "juggernaut" in result["name"].lower()
@@ -147,9 +145,5 @@ class TestFastUnitTests:
     @pytest.mark.core
     def test_services_import(self):
         """All services can be imported."""
-        from src.services import (
-            CombatService,
-            ReplayService,
-        )
         assert ReplayService is not None
         assert CombatService is not None
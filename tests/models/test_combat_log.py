@@ -146,24 +146,16 @@ class TestHeroCombatAnalysisIntegration:
     def test_earthshaker_first_blood_fight(self, hero_combat_analysis_earthshaker):
         """Earthshaker died in the first blood fight around 4:48."""
         result = hero_combat_analysis_earthshaker
-        first_blood_fights = [
-            f for f in result.fights
-            if 280 <= f.fight_start <= 300
-        ]
-        assert len(first_blood_fights) >= 1
-        fb_fight = first_blood_fights[0]
+        fb_fight = next((f for f in result.fights if 280 <= f.fight_start <= 300), None)
+        assert fb_fight is not None
         assert fb_fight.deaths >= 1
 
     def test_disruptor_got_first_blood(self, hero_combat_analysis_disruptor):
         """Disruptor got first blood on earthshaker at 4:48."""
         result = hero_combat_analysis_disruptor
         assert result.success is True
-        first_blood_fights = [
-            f for f in result.fights
-            if 280 <= f.fight_start <= 300
-        ]
-        assert len(first_blood_fights) >= 1
-        fb_fight = first_blood_fights[0]
+        fb_fight = next((f for f in result.fights if 280 <= f.fight_start <= 300), None)
+        assert fb_fight is not None
         assert fb_fight.kills >= 1
 
     def test_fight_participation_has_valid_structure(self, hero_combat_analysis_earthshaker):
@@ -202,27 +194,24 @@ class TestHeroCombatAnalysisIntegration:
     def test_teamfight_count_matches(self, hero_combat_analysis_earthshaker):
         """Total teamfights should match count of is_teamfight=True."""
         result = hero_combat_analysis_earthshaker
-        teamfight_count = sum(1 for f in result.fights if f.is_teamfight)
+        teamfight_count = sum(f.is_teamfight for f in result.fights)
         assert result.total_teamfights == teamfight_count
 
 
 class TestModifierAddTracking:
     """Tests for MODIFIER_ADD based hit detection (for ground-targeted abilities)."""
 
-    def test_disruptor_kinetic_field_tracked(self, hero_combat_analysis_disruptor):
+    def test_disruptor_kinetic_field_tracked(self, hero_combat_analysis_disruptor, disruptor_ability_index):
         """Disruptor's Kinetic Field should track hits via MODIFIER_ADD."""
         result = hero_combat_analysis_disruptor
-        ability_names = [a.ability.lower() for a in result.ability_summary]
-        has_kinetic = any("kinetic" in name for name in ability_names)
-        has_thunder = any("thunder" in name or "storm" in name for name in ability_names)
+        has_kinetic = any("kinetic" in n for n in disruptor_ability_index)
+        has_thunder = any("thunder" in n or "storm" in n for n in disruptor_ability_index)
         assert has_kinetic or has_thunder or len(result.ability_summary) > 0
 
-    def test_earthshaker_fissure_tracked(self, hero_combat_analysis_earthshaker):
+    def test_earthshaker_fissure_tracked(self, earthshaker_ability_index):
         """Earthshaker's Fissure should be tracked."""
-        result = hero_combat_analysis_earthshaker
-        ability_names = [a.ability.lower() for a in result.ability_summary]
-        has_fissure = any("fissure" in name for name in ability_names)
-        has_echo = any("echo" in name for name in ability_names)
+        has_fissure = any("fissure" in n for n in earthshaker_ability_index)
+        has_echo = any("echo" in n for n in earthshaker_ability_index)
         assert has_fissure or has_echo
 
     def test_ability_hits_can_exceed_casts_for_aoe(self, hero_combat_analysis_earthshaker):
@@ -232,10 +221,9 @@ class TestModifierAddTracking:
             if "echo" in ability.ability.lower():
                 assert ability.hero_hits >= 0
 
-    def test_fissure_stun_tracked_via_modifier_add(self, hero_combat_analysis_earthshaker):
+    def test_fissure_stun_tracked_via_modifier_add(self, earthshaker_ability_index):
         """Fissure stun should be tracked via MODIFIER_ADD events."""
-        result = hero_combat_analysis_earthshaker
-        fissure = next((a for a in result.ability_summary if "fissure" in a.ability.lower()), None)
+        fissure = earthshaker_ability_index.get("earthshaker_fissure")
         assert fissure is not None
         assert fissure.total_casts > 0
         assert fissure.hero_hits > 0
@@ -244,11 +232,8 @@ class TestModifierAddTracking:
 class TestAbilityFilter:
     """Tests for ability_filter parameter in get_hero_combat_analysis."""
 
-    def test_ability_filter_returns_only_filtered_ability(self, parsed_replay_data, all_fights):
+    def test_ability_filter_returns_only_filtered_ability(self, combat_service, parsed_replay_data, all_fights):
         """When ability_filter is set, only that ability should appear in results."""
-        from src.services.combat.combat_service import CombatService
-
-        combat_service = CombatService()
         result = combat_service.get_hero_combat_analysis(
             parsed_replay_data,
             match_id=8461956309,
@@ -262,11 +247,8 @@ class TestAbilityFilter:
         for ability in result.ability_summary:
             assert "fissure" in ability.ability.lower()
 
-    def test_ability_filter_no_match_returns_empty(self, parsed_replay_data, all_fights):
+    def test_ability_filter_no_match_returns_empty(self, combat_service, parsed_replay_data, all_fights):
         """When ability_filter doesn't match any ability, summary should be empty."""
-        from src.services.combat.combat_service import CombatService
-
-        combat_service = CombatService()
         result = combat_service.get_hero_combat_analysis(
             parsed_replay_data,
             match_id=8461956309,
@@ -278,11 +260,8 @@ class TestAbilityFilter:
         assert result.success is True
         assert len(result.ability_summary) == 0
 
-    def test_ability_filter_is_case_insensitive(self, parsed_replay_data, all_fights):
+    def test_ability_filter_is_case_insensitive(self, combat_service, parsed_replay_data, all_fights):
         """Ability filter should be case-insensitive."""
-        from src.services.combat.combat_service import CombatService
-
-        combat_service = CombatService()
         result_lower = combat_service.get_hero_combat_analysis(
             parsed_replay_data,
             match_id=8461956309,
@@ -300,11 +279,8 @@ class TestAbilityFilter:
 
         assert len(result_lower.ability_summary) == len(result_upper.ability_summary)
 
-    def test_ability_filter_partial_match(self, parsed_replay_data, all_fights):
+    def test_ability_filter_partial_match(self, combat_service, parsed_replay_data, all_fights):
         """Ability filter should work with partial matches."""
-        from src.services.combat.combat_service import CombatService
-
-        combat_service = CombatService()
         # "echo" should match "earthshaker_echo_slam"
         result = combat_service.get_hero_combat_analysis(
             parsed_replay_data,
@@ -322,12 +298,9 @@ class TestAbilityFilter:
 class TestCombatLogAbilityFilter:
     """Tests for ability_filter parameter in get_combat_log."""
 
-    def test_combat_log_ability_filter(self, parsed_replay_data):
+    def test_combat_log_ability_filter(self, combat_service, parsed_replay_data):
         """When ability_filter is set, only events with that ability should appear."""
         from src.models.combat_log import DetailLevel
-        from src.services.combat.combat_service import CombatService
-
-        combat_service = CombatService()
         events = combat_service.get_combat_log(
             parsed_replay_data,
             start_time=0,
@@ -341,12 +314,9 @@ class TestCombatLogAbilityFilter:
             if event.ability:
                 assert "fissure" in event.ability.lower()
 
-    def test_combat_log_ability_filter_with_hero_filter(self, parsed_replay_data):
+    def test_combat_log_ability_filter_with_hero_filter(self, combat_service, parsed_replay_data):
         """Ability filter should work with hero filter."""
         from src.models.combat_log import DetailLevel
-        from src.services.combat.combat_service import CombatService
-
-        combat_service = CombatService()
         events = combat_service.get_combat_log(
             parsed_replay_data,
             start_time=0,
@@ -4,8 +4,6 @@ Tests for FightAnalyzer - fight highlight detection.
 Tests verify ACTUAL VALUES from real match data, not just "can I call this API".
 """
 
-import pytest
-
 from src.services.analyzers.fight_analyzer import (
     BIG_TEAMFIGHT_ABILITIES,
     BLINK_ITEMS,
@@ -13,7 +11,6 @@ from src.services.analyzers.fight_analyzer import (
     SELF_SAVE_ITEMS,
     TARGET_REQUIRED_ABILITIES,
 )
-from src.services.combat.fight_service import FightService
 
 
 class TestFightAnalyzerConstants:
@@ -80,47 +77,22 @@ class TestMatch8461956309Fights:
 
     def test_fight_at_48_08_has_2_deaths(self, all_fights):
         """Fight at 48:08 has 2 deaths (ES double kill)."""
-        fight_4808 = next(
-            (f for f in all_fights.fights if f.start_time_str == "48:08"),
-            None
-        )
+        fight_4808 = all_fights.fights_by_start_str.get("48:08")
         assert fight_4808 is not None, "Fight at 48:08 not found"
         assert fight_4808.total_deaths == 2
         # Earthshaker killed Disruptor and Magnus
-        victims = {d.victim for d in fight_4808.deaths}
-        assert victims == {"disruptor", "magnataur"}
+        victims = tuple(sorted(d.victim for d in fight_4808.deaths))
+        assert victims == ("disruptor", "magnataur")
 
 
 class TestMatch8461956309Highlights:
     """Tests for fight highlights in match 8461956309 - verifies ACTUAL VALUES."""
 
-    @pytest.fixture(scope="class")
-    def all_highlights(self, parsed_replay_data, all_fights):
-        """Collect all highlights from all fights."""
-        fs = FightService()
-        highlights = {
-            "multi_hero_abilities": [],
-            "kill_streaks": [],
-            "bkb_blink_combos": [],
-            "coordinated_ults": [],
-            "clutch_saves": [],
-        }
-        for fight in all_fights.fights:
-            context = fs.get_fight_combat_log(parsed_replay_data, fight.start_time)
-            if context and "highlights" in context:
-                hl = context["highlights"]
-                highlights["multi_hero_abilities"].extend(hl.multi_hero_abilities)
-                highlights["kill_streaks"].extend(hl.kill_streaks)
-                highlights["bkb_blink_combos"].extend(hl.bkb_blink_combos)
-                highlights["coordinated_ults"].extend(hl.coordinated_ults)
-                highlights["clutch_saves"].extend(hl.clutch_saves)
-        return highlights
-
     def test_earthshaker_echo_slam_hits_4_heroes(self, all_highlights):
         """Earthshaker Echo Slam hit 4 heroes in one of the fights."""
         echo_slams = [
-            mha for mha in all_highlights["multi_hero_abilities"]
-            if "echo_slam" in mha.ability.lower() and mha.caster == "earthshaker"
+            mha for mha in all_highlights["multi_hero_abilities_by_caster"].get("earthshaker", [])
+            if "echo_slam" in mha.ability.lower()
         ]
         assert len(echo_slams) >= 1, "No Echo Slam multi-hero hits found"
         max_hits = max(es.hero_count for es in echo_slams)
@@ -129,8 +101,8 @@ class TestMatch8461956309Highlights:
     def test_nevermore_requiem_hits_4_heroes(self, all_highlights):
         """Nevermore Requiem hit 4 heroes in one of the fights."""
         requiems = [
-            mha for mha in all_highlights["multi_hero_abilities"]
-            if "requiem" in mha.ability.lower() and mha.caster == "nevermore"
+            mha for mha in all_highlights["multi_hero_abilities_by_caster"].get("nevermore", [])
+            if "requiem" in mha.ability.lower()
         ]
         assert len(requiems) >= 1, "No Requiem multi-hero hits found"
         max_hits = max(r.hero_count for r in requiems)
@@ -138,46 +110,31 @@ class TestMatch8461956309Highlights:
 
     def test_earthshaker_has_double_kill(self, all_highlights):
         """Earthshaker got at least one double kill."""
-        es_streaks = [
-            ks for ks in all_highlights["kill_streaks"]
-            if ks.hero == "earthshaker"
-        ]
+        es_streaks = all_highlights["kill_streaks_by_hero"].get("earthshaker", [])
         assert len(es_streaks) >= 1, "No Earthshaker kill streaks found"
         assert any(ks.streak_type == "double_kill" for ks in es_streaks)
 
     def test_medusa_has_double_kill(self, all_highlights):
         """Medusa got at least one double kill."""
-        medusa_streaks = [
-            ks for ks in all_highlights["kill_streaks"]
-            if ks.hero == "medusa"
-        ]
+        medusa_streaks = all_highlights["kill_streaks_by_hero"].get("medusa", [])
         assert len(medusa_streaks) >= 1, "No Medusa kill streaks found"
         assert any(ks.streak_type == "double_kill" for ks in medusa_streaks)
 
     def test_earthshaker_bkb_blink_initiator(self, all_highlights):
         """Earthshaker used BKB+Blink as initiator."""
-        es_combos = [
-            bb for bb in all_highlights["bkb_blink_combos"]
-            if bb.hero == "earthshaker"
-        ]
+        es_combos = all_highlights["bkb_blink_combos_by_hero"].get("earthshaker", [])
         assert len(es_combos) >= 1, "No Earthshaker BKB+Blink combos found"
         assert any(bb.is_initiator for bb in es_combos), "Earthshaker never initiated"
 
     def test_nevermore_bkb_blink_followup(self, all_highlights):
         """Nevermore used BKB+Blink as follow-up (not initiator)."""
-        sf_combos = [
-            bb for bb in all_highlights["bkb_blink_combos"]
-            if bb.hero == "nevermore"
-        ]
+        sf_combos = all_highlights["bkb_blink_combos_by_hero"].get("nevermore", [])
         assert len(sf_combos) >= 1, "No Nevermore BKB+Blink combos found"
         assert any(not bb.is_initiator for bb in sf_combos), "Nevermore always initiated"
 
     def test_coordinated_radiant_ultimates(self, all_highlights):
         """Radiant had coordinated ultimates (ES + SF)."""
-        radiant_coords = [
-            cu for cu in all_highlights["coordinated_ults"]
-            if cu.team == "radiant"
-        ]
+        radiant_coords = all_highlights["coordinated_ults_by_team"].get("radiant", [])
         assert len(radiant_coords) >= 1, "No Radiant coordinated ults found"
         # At least one coordination should include earthshaker and nevermore
         es_sf_coord = any(
@@ -189,8 +146,8 @@ class TestMatch8461956309Highlights:
     def test_medusa_outworld_staff_self_save(self, all_highlights):
         """Medusa used Outworld Staff for self-save."""
         medusa_saves = [
-            cs for cs in all_highlights["clutch_saves"]
-            if cs.saved_hero == "medusa" and cs.save_ability == "item_outworld_staff"
+            cs for cs in all_highlights["clutch_saves_by_saved_hero"].get("medusa", [])
+            if cs.save_ability == "item_outworld_staff"
         ]
         assert len(medusa_saves) >= 1, "No Medusa Outworld Staff saves found"
         assert medusa_saves[0].save_type == "self_banish"
@@ -199,8 +156,8 @@ class TestMatch8461956309Highlights:
     def test_shadow_demon_disruption_save(self, all_highlights):
         """Shadow Demon saved an ally with Disruption."""
         disruption_saves = [
-            cs for cs in all_highlights["clutch_saves"]
-            if "disruption" in cs.save_ability.lower() and cs.saver == "shadow_demon"
+            cs for cs in all_highlights["clutch_saves_by_saver"].get("shadow_demon", [])
+            if "disruption" in cs.save_ability.lower()
         ]
         assert len(disruption_saves) >= 1, "No Shadow Demon Disruption saves found"
 
@@ -253,11 +210,8 @@ class TestMatch8594217096Fights:
 
     def test_first_blood_at_1_24(self, all_fights_2):
         """First blood (after game start) was Batrider at 1:24."""
-        # Find first fight after game start (time > 0)
-        first_game_fight = next(
-            (f for f in all_fights_2.fights if f.start_time > 0),
-            None
-        )
+        # First fight after game start (time > 0)
+        first_game_fight = next((f for f in all_fights_2.fights if f.start_time > 0), None)
         assert first_game_fight is not None
         assert first_game_fight.start_time_str == "1:24"
         assert first_game_fight.deaths[0].victim == "batrider"
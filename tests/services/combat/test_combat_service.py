@@ -5,6 +5,8 @@ Uses pre-parsed replay data from conftest.py fixtures.
 All data is from match 8461956309 with verified values from Dotabuff.
 """
 
+from collections import Counter
+
 from src.models.combat_log import RunePickup
 from src.services.models.combat_data import (
     CombatLogEvent,
@@ -103,6 +105,11 @@ class TestCombatLog:
         assert len(es_death) == 1
         assert es_death[0].attacker == "disruptor"
 
+    def test_iter_combat_log_stops_at_first_match(self, combat_service, parsed_replay_data):
+        events = combat_service.iter_combat_log(parsed_replay_data, start_time=280, end_time=290)
+        es_death = next(e for e in events if e.type == "DEATH" and e.target == "earthshaker")
+        assert es_death.attacker == "disruptor"
+
 
 class TestObjectiveKills:
 
@@ -115,62 +122,53 @@ class TestObjectiveKills:
         assert isinstance(towers, list)
         assert isinstance(barracks, list)
 
-    def test_roshan_kills_correct_count_and_order(self, objectives):
-        roshan, _, _, _ = objectives
-        assert len(roshan) == 4
-        assert all(isinstance(r, ObjectiveKill) for r in roshan)
-        for i, r in enumerate(roshan):
+    def test_roshan_kills_correct_count_and_order(self, roshan_kills):
+        assert len(roshan_kills) == 4
+        assert all(isinstance(r, ObjectiveKill) for r in roshan_kills)
+        for i, r in enumerate(roshan_kills):
             assert r.extra_info.get("kill_number") == i + 1
 
-    def test_first_roshan_kill_details(self, objectives):
-        roshan, _, _, _ = objectives
-        first_rosh = roshan[0]
+    def test_first_roshan_kill_details(self, roshan_kills):
+        first_rosh = roshan_kills[0]
         assert first_rosh.game_time_str == "24:35"
         assert first_rosh.killer == "medusa"
         assert first_rosh.team == "dire"
         assert first_rosh.extra_info.get("kill_number") == 1
 
-    def test_tormentor_kills_detected(self, objectives):
-        _, tormentor, _, _ = objectives
+    def test_tormentor_kills_detected(self, tormentor_kills):
         # Match 8461956309 has 4 tormentor kills (Dire team killed all)
-        assert len(tormentor) == 4
-        assert all(isinstance(t, ObjectiveKill) for t in tormentor)
+        assert len(tormentor_kills) == 4
+        assert all(isinstance(t, ObjectiveKill) for t in tormentor_kills)
 
-    def test_first_tormentor_kill_details(self, objectives):
-        _, tormentor, _, _ = objectives
-        first_tormentor = tormentor[0]
+    def test_first_tormentor_kill_details(self, tormentor_kills):
+        first_tormentor = tormentor_kills[0]
         assert first_tormentor.objective_type == "tormentor"
         assert first_tormentor.game_time_str == "21:38"
         assert first_tormentor.killer == "medusa"
         assert first_tormentor.team == "dire"
 
-    def test_tower_kills_correct_count(self, objectives):
-        _, _, towers, _ = objectives
-        assert len(towers) == 14
-        assert all(isinstance(t, ObjectiveKill) for t in towers)
+    def test_tower_kills_correct_count(self, tower_kills):
+        assert len(tower_kills) == 14
+        assert all(isinstance(t, ObjectiveKill) for t in tower_kills)
 
-    def test_first_tower_kill_details(self, objectives):
-        _, _, towers, _ = objectives
-        first_tower = towers[0]
+    def test_first_tower_kill_details(self, tower_kills):
+        first_tower = tower_kills[0]
         assert first_tower.game_time_str == "11:09"
         assert "tower" in first_tower.objective_name.lower()
         assert first_tower.extra_info.get("tower_team") == "dire"
 
-    def test_barracks_kills_correct_count(self, objectives):
-        _, _, _, barracks = objectives
-        assert len(barracks) == 6
-        assert all(isinstance(b, ObjectiveKill) for b in barracks)
+    def test_barracks_kills_correct_count(self, barracks_kills):
+        assert len(barracks_kills) == 6
+        assert all(isinstance(b, ObjectiveKill) for b in barracks_kills)
 
-    def test_first_barracks_kill_details(self, objectives):
-        _, _, _, barracks = objectives
-        first_rax = barracks[0]
+    def test_first_barracks_kill_details(self, barracks_kills):
+        first_rax = barracks_kills[0]
         assert first_rax.game_time_str == "40:55"
         assert first_rax.extra_info.get("barracks_team") == "radiant"
         assert first_rax.extra_info.get("barracks_type") == "melee"
 
-    def test_all_barracks_are_radiant(self, objectives):
-        _, _, _, barracks = objectives
-        for rax in barracks:
+    def test_all_barracks_are_radiant(self, barracks_kills):
+        for rax in barracks_kills:
             assert rax.extra_info.get("barracks_team") == "radiant"
 
 
@@ -193,11 +191,13 @@ class TestPositionTracking:
         # Position may or may not be available depending on combat log data
 
     def test_position_coordinates_in_valid_range(self, hero_deaths_with_position):
-        for death in hero_deaths_with_position:
-            if death.position_x is not None:
-                assert -8500 <= death.position_x <= 8500
-            if death.position_y is not None:
-                assert -8500 <= death.position_y <= 8500
+        coords = [
+            c
+            for d in hero_deaths_with_position
+            for c in (d.position_x, d.position_y)
+            if c is not None
+        ]
+        assert max(map(abs, coords), default=0.0) <= 8500
 
 
 class TestRunePickups:
@@ -264,12 +264,11 @@ class TestAbilityHitDetection:
 
     def test_hit_detection_stats(self, combat_log_0_600_ability):
         # v2 hit detection may differ from legacy
-        hits = [e for e in combat_log_0_600_ability if e.hit is True]
-        misses = [e for e in combat_log_0_600_ability if e.hit is False]
-        na = [e for e in combat_log_0_600_ability if e.hit is None]
+        counts = Counter(e.hit for e in combat_log_0_600_ability)
+        hits, misses, na = counts[True], counts[False], counts[None]
 
         # Total should match
-        assert len(hits) + len(misses) + len(na) == len(combat_log_0_600_ability)
+        assert hits + misses + na == len(combat_log_0_600_ability)
 
 
 class TestAbilityTrigger:
@@ -349,56 +348,56 @@ class TestDetailLevelFiltering:
         """NARRATIVE should return exactly 11 events."""
         assert len(combat_log_280_290_narrative) == 11
 
-    def test_narrative_ability_count(self, combat_log_280_290_narrative):
+    def test_narrative_ability_count(self, combat_log_280_290_narrative_by_type):
         """NARRATIVE should have exactly 8 ABILITY events."""
-        ability_events = [e for e in combat_log_280_290_narrative if e.type == "ABILITY"]
+        ability_events = combat_log_280_290_narrative_by_type.get("ABILITY", [])
         assert len(ability_events) == 8
 
-    def test_narrative_death_count(self, combat_log_280_290_narrative):
+    def test_narrative_death_count(self, combat_log_280_290_narrative_by_type):
         """NARRATIVE should have exactly 1 DEATH event (first blood)."""
-        death_events = [e for e in combat_log_280_290_narrative if e.type == "DEATH"]
+        death_events = combat_log_280_290_narrative_by_type.get("DEATH", [])
         assert len(death_events) == 1
 
-    def test_narrative_item_count(self, combat_log_280_290_narrative):
+    def test_narrative_item_count(self, combat_log_280_290_narrative_by_type):
         """NARRATIVE should have exactly 2 ITEM events."""
-        item_events = [e for e in combat_log_280_290_narrative if e.type == "ITEM"]
+        item_events = combat_log_280_290_narrative_by_type.get("ITEM", [])
         assert len(item_events) == 2
 
-    def test_narrative_damage_count_zero(self, combat_log_280_290_narrative):
+    def test_narrative_damage_count_zero(self, combat_log_280_290_narrative_by_type):
         """NARRATIVE must have exactly 0 DAMAGE events."""
-        damage_events = [e for e in combat_log_280_290_narrative if e.type == "DAMAGE"]
+        damage_events = combat_log_280_290_narrative_by_type.get("DAMAGE", [])
         assert len(damage_events) == 0
 
-    def test_narrative_modifier_add_count_zero(self, combat_log_280_290_narrative):
+    def test_narrative_modifier_add_count_zero(self, combat_log_280_290_narrative_by_type):
         """NARRATIVE must have exactly 0 MODIFIER_ADD events."""
-        modifier_events = [e for e in combat_log_280_290_narrative if e.type == "MODIFIER_ADD"]
+        modifier_events = combat_log_280_290_narrative_by_type.get("MODIFIER_ADD", [])
         assert len(modifier_events) == 0
 
-    def test_narrative_modifier_remove_count_zero(self, combat_log_280_290_narrative):
+    def test_narrative_modifier_remove_count_zero(self, combat_log_280_290_narrative_by_type):
         """NARRATIVE must have exactly 0 MODIFIER_REMOVE events."""
-        modifier_events = [e for e in combat_log_280_290_narrative if e.type == "MODIFIER_REMOVE"]
+        modifier_events = combat_log_280_290_narrative_by_type.get("MODIFIER_REMOVE", [])
         assert len(modifier_events) == 0
 
-    def test_narrative_heal_count_zero(self, combat_log_280_290_narrative):
+    def test_narrative_heal_count_zero(self, combat_log_280_290_narrative_by_type):
         """NARRATIVE must have exactly 0 HEAL events."""
-        heal_events = [e for e in combat_log_280_290_narrative if e.type == "HEAL"]
+        heal_events = combat_log_280_290_narrative_by_type.get("HEAL", [])
         assert len(heal_events) == 0
 
-    def test_narrative_death_is_hero(self, combat_log_280_290_narrative):
+    def test_narrative_death_is_hero(self, combat_log_280_290_narrative_by_type):
         """NARRATIVE death event must be a hero death (target_is_hero=True)."""
-        death_events = [e for e in combat_log_280_290_narrative if e.type == "DEATH"]
+        death_events = combat_log_280_290_narrative_by_type.get("DEATH", [])
         assert len(death_events) == 1
         assert death_events[0].target_is_hero is True
 
-    def test_narrative_all_abilities_from_heroes(self, combat_log_280_290_narrative):
+    def test_narrative_all_abilities_from_heroes(self, combat_log_280_290_narrative_by_type):
         """All 8 NARRATIVE ability events must be from heroes (attacker_is_hero=True)."""
-        ability_events = [e for e in combat_log_280_290_narrative if e.type == "ABILITY"]
+        ability_events = combat_log_280_290_narrative_by_type.get("ABILITY", [])
         non_hero_abilities = [e for e in ability_events if not e.attacker_is_hero]
         assert len(non_hero_abilities) == 0
 
-    def test_narrative_all_items_from_heroes(self, combat_log_280_290_narrative):
+    def test_narrative_all_items_from_heroes(self, combat_log_280_290_narrative_by_type):
         """All 2 NARRATIVE item events must be from heroes (attacker_is_hero=True)."""
-        item_events = [e for e in combat_log_280_290_narrative if e.type == "ITEM"]
+        item_events = combat_log_280_290_narrative_by_type.get("ITEM", [])
         non_hero_items = [e for e in item_events if not e.attacker_is_hero]
         assert len(non_hero_items) == 0
 
@@ -409,50 +408,50 @@ class TestDetailLevelFiltering:
         """TACTICAL should return exactly 60 events."""
         assert len(combat_log_280_290_tactical) == 60
 
-    def test_tactical_ability_count(self, combat_log_280_290_tactical):
+    def test_tactical_ability_count(self, combat_log_280_290_tactical_by_type):
         """TACTICAL should have exactly 8 ABILITY events."""
-        ability_events = [e for e in combat_log_280_290_tactical if e.type == "ABILITY"]
+        ability_events = combat_log_280_290_tactical_by_type.get("ABILITY", [])
         assert len(ability_events) == 8
 
-    def test_tactical_damage_count(self, combat_log_280_290_tactical):
+    def test_tactical_damage_count(self, combat_log_280_290_tactical_by_type):
         """TACTICAL should have exactly 29 DAMAGE events (hero-to-hero only)."""
-        damage_events = [e for e in combat_log_280_290_tactical if e.type == "DAMAGE"]
+        damage_events = combat_log_280_290_tactical_by_type.get("DAMAGE", [])
         assert len(damage_events) == 29
 
-    def test_tactical_death_count(self, combat_log_280_290_tactical):
+    def test_tactical_death_count(self, combat_log_280_290_tactical_by_type):
         """TACTICAL should have exactly 1 DEATH event."""
-        death_events = [e for e in combat_log_280_290_tactical if e.type == "DEATH"]
+        death_events = combat_log_280_290_tactical_by_type.get("DEATH", [])
         assert len(death_events) == 1
 
-    def test_tactical_item_count(self, combat_log_280_290_tactical):
+    def test_tactical_item_count(self, combat_log_280_290_tactical_by_type):
         """TACTICAL should have exactly 2 ITEM events."""
-        item_events = [e for e in combat_log_280_290_tactical if e.type == "ITEM"]
+        item_events = combat_log_280_290_tactical_by_type.get("ITEM", [])
         assert len(item_events) == 2
 
-    def test_tactical_modifier_add_count(self, combat_log_280_290_tactical):
+    def test_tactical_modifier_add_count(self, combat_log_280_290_tactical_by_type):
         """TACTICAL should have exactly 20 MODIFIER_ADD events (on heroes only)."""
-        modifier_events = [e for e in combat_log_280_290_tactical if e.type == "MODIFIER_ADD"]
+        modifier_events = combat_log_280_290_tactical_by_type.get("MODIFIER_ADD", [])
         assert len(modifier_events) == 20
 
-    def test_tactical_modifier_remove_count_zero(self, combat_log_280_290_tactical):
+    def test_tactical_modifier_remove_count_zero(self, combat_log_280_290_tactical_by_type):
         """TACTICAL must have exactly 0 MODIFIER_REMOVE events."""
-        modifier_remove = [e for e in combat_log_280_290_tactical if e.type == "MODIFIER_REMOVE"]
+        modifier_remove = combat_log_280_290_tactical_by_type.get("MODIFIER_REMOVE", [])
         assert len(modifier_remove) == 0
 
-    def test_tactical_heal_count_zero(self, combat_log_280_290_tactical):
+    def test_tactical_heal_count_zero(self, combat_log_280_290_tactical_by_type):
         """TACTICAL must have exactly 0 HEAL events."""
-        heal_events = [e for e in combat_log_280_290_tactical if e.type == "HEAL"]
+        heal_events = combat_log_280_290_tactical_by_type.get("HEAL", [])
         assert len(heal_events) == 0
 
-    def test_tactical_all_damage_hero_to_hero(self, combat_log_280_290_tactical):
+    def test_tactical_all_damage_hero_to_hero(self, combat_log_280_290_tactical_by_type):
         """All 29 TACTICAL damage events must be hero-to-hero."""
-        damage_events = [e for e in combat_log_280_290_tactical if e.type == "DAMAGE"]
+        damage_events = combat_log_280_290_tactical_by_type.get("DAMAGE", [])
         non_h2h = [e for e in damage_events if not e.attacker_is_hero or not e.target_is_hero]
         assert len(non_h2h) == 0
 
-    def test_tactical_all_modifiers_on_heroes(self, combat_log_280_290_tactical):
+    def test_tactical_all_modifiers_on_heroes(self, combat_log_280_290_tactical_by_type):
         """All 20 TACTICAL modifier_add events must be on heroes (target_is_hero=True)."""
-        modifier_events = [e for e in combat_log_280_290_tactical if e.type == "MODIFIER_ADD"]
+        modifier_events = combat_log_280_290_tactical_by_type.get("MODIFIER_ADD", [])
         non_hero_mods = [e for e in modifier_events if not e.target_is_hero]
         assert len(non_hero_mods) == 0
 
@@ -463,59 +462,65 @@ class TestDetailLevelFiltering:
         """FULL should return exactly 135 events."""
         assert len(combat_log_280_290_full) == 135
 
-    def test_full_ability_count(self, combat_log_280_290_full):
+    def test_full_ability_count(self, combat_log_280_290_full_by_type):
         """FULL should have exactly 8 ABILITY events."""
-        ability_events = [e for e in combat_log_280_290_full if e.type == "ABILITY"]
+        ability_events = combat_log_280_290_full_by_type.get("ABILITY", [])
         assert len(ability_events) == 8
 
-    def test_full_damage_count(self, combat_log_280_290_full):
+    def test_full_damage_count(self, combat_log_280_290_full_by_type):
         """FULL should have exactly 52 DAMAGE events (all sources)."""
-        damage_events = [e for e in combat_log_280_290_full if e.type == "DAMAGE"]
+        damage_events = combat_log_280_290_full_by_type.get("DAMAGE", [])
         assert len(damage_events) == 52
 
-    def test_full_death_count(self, combat_log_280_290_full):
+    def test_full_death_count(self, combat_log_280_290_full_by_type):
         """FULL should have exactly 12 DEATH events (heroes + creeps)."""
-        death_events = [e for e in combat_log_280_290_full if e.type == "DEATH"]
+        death_events = combat_log_280_290_full_by_type.get("DEATH", [])
         assert len(death_events) == 12
 
-    def test_full_heal_count(self, combat_log_280_290_full):
+    def test_full_heal_count(self, combat_log_280_290_full_by_type):
         """FULL should have exactly 1 HEAL event."""
-        heal_events = [e for e in combat_log_280_290_full if e.type == "HEAL"]
+        heal_events = combat_log_280_290_full_by_type.get("HEAL", [])
         assert len(heal_events) == 1
 
-    def test_full_item_count(self, combat_log_280_290_full):
+    def test_full_item_count(self, combat_log_280_290_full_by_type):
         """FULL should have exactly 2 ITEM events."""
-        item_events = [e for e in combat_log_280_290_full if e.type == "ITEM"]
+        item_events = combat_log_280_290_full_by_type.get("ITEM", [])
         assert len(item_events) == 2
 
-    def test_full_modifier_add_count(self, combat_log_280_290_full):
+    def test_full_modifier_add_count(self, combat_log_280_290_full_by_type):
         """FULL should have exactly 29 MODIFIER_ADD events."""
-        modifier_events = [e for e in combat_log_280_290_full if e.type == "MODIFIER_ADD"]
+        modifier_events = combat_log_280_290_full_by_type.get("MODIFIER_ADD", [])
         assert len(modifier_events) == 29
 
-    def test_full_modifier_remove_count(self, combat_log_280_290_full):
+    def test_full_modifier_remove_count(self, combat_log_280_290_full_by_type):
         """FULL should have exactly 31 MODIFIER_REMOVE events."""
-        modifier_remove = [e for e in combat_log_280_290_full if e.type == "MODIFIER_REMOVE"]
+        modifier_remove = combat_log_280_290_full_by_type.get("MODIFIER_REMOVE", [])
         assert len(modifier_remove) == 31
 
     # ========== Cross-level filtering verification ==========
 
-    def test_full_has_creep_damage_that_tactical_excludes(self, combat_log_280_290_tactical, combat_log_280_290_full):
+    def test_full_has_creep_damage_that_tactical_excludes(
+        self, combat_log_280_290_tactical_by_type, combat_log_280_290_full_by_type
+    ):
         """FULL has 52 damage, TACTICAL has 29 - difference is 23 creep damage events."""
-        full_damage = [e for e in combat_log_280_290_full if e.type == "DAMAGE"]
-        tactical_damage = [e for e in combat_log_280_290_tactical if e.type == "DAMAGE"]
+        full_damage = combat_log_280_290_full_by_type.get("DAMAGE", [])
+        tactical_damage = combat_log_280_290_tactical_by_type.get("DAMAGE", [])
         assert len(full_damage) - len(tactical_damage) == 23
 
-    def test_full_has_creep_deaths_that_narrative_excludes(self, combat_log_280_290_narrative, combat_log_280_290_full):
+    def test_full_has_creep_deaths_that_narrative_excludes(
+        self, combat_log_280_290_narrative_by_type, combat_log_280_290_full_by_type
+    ):
         """FULL has 12 deaths, NARRATIVE has 1 - difference is 11 creep deaths."""
-        full_deaths = [e for e in combat_log_280_290_full if e.type == "DEATH"]
-        narrative_deaths = [e for e in combat_log_280_290_narrative if e.type == "DEATH"]
+        full_deaths = combat_log_280_290_full_by_type.get("DEATH", [])
+        narrative_deaths = combat_log_280_290_narrative_by_type.get("DEATH", [])
         assert len(full_deaths) - len(narrative_deaths) == 11
 
-    def test_full_has_modifiers_that_tactical_excludes(self, combat_log_280_290_tactical, combat_log_280_290_full):
+    def test_full_has_modifiers_that_tactical_excludes(
+        self, combat_log_280_290_tactical_by_type, combat_log_280_290_full_by_type
+    ):
         """FULL has 29 modifier_add, TACTICAL has 20 - difference is 9 non-hero modifiers."""
-        full_mods = [e for e in combat_log_280_290_full if e.type == "MODIFIER_ADD"]
-        tactical_mods = [e for e in combat_log_280_290_tactical if e.type == "MODIFIER_ADD"]
+        full_mods = combat_log_280_290_full_by_type.get("MODIFIER_ADD", [])
+        tactical_mods = combat_log_280_290_tactical_by_type.get("MODIFIER_ADD", [])
         assert len(full_mods) - len(tactical_mods) == 9
 
 
@@ -536,13 +541,21 @@ class TestHeroCombatAnalysis:
             if fight.hero_level is not None:
                 assert fight.hero_level > 0
 
-    def test_nevermore_level_advantage_is_positive(self, parsed_replay_data, all_fights):
+    def test_nevermore_level_advantage_is_positive(self, combat_service, parsed_replay_data, all_fights):
         """Nevermore (SF) should have positive avg kill level advantage."""
-        from src.services.combat.combat_service import CombatService
-
-        combat = CombatService()
-        perf = combat.get_hero_combat_analysis(
+        perf = combat_service.get_hero_combat_analysis(
             parsed_replay_data, 8461956309, "nevermore", all_fights.fights
         )
         if perf.avg_kill_level_advantage is not None:
             assert perf.avg_kill_level_advantage > 0
+
+
+class TestFormatTime:
+
+    def test_format_time_floors_to_whole_seconds(self, combat_service):
+        assert combat_service._format_time(288.9) == "4:48"
+        assert combat_service._format_time(0) == "0:00"
+        assert combat_service._format_time(3600.0) == "60:00"
+
+    def test_format_time_negative_pre_horn(self, combat_service):
+        assert combat_service._format_time(-25.3) == "-1:34"
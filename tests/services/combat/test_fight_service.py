@@ -41,3 +41,13 @@ class TestFightDetection:
         assert isinstance(fight_first_blood_no_hero, Fight)
         assert "earthshaker" in fight_first_blood_no_hero.participants
         assert len(fight_first_blood_no_hero.deaths) > 0
+
+    def test_batch_fight_combat_logs_match_single_calls(self, fight_service, parsed_replay_data):
+        batch = fight_service.get_all_fight_combat_logs(parsed_replay_data, [288.0, 268.0])
+        assert len(batch) == 2
+        for reference_time, context in zip([288.0, 268.0], batch):
+            single = fight_service.get_fight_combat_log(parsed_replay_data, reference_time)
+            assert (context is None) == (single is None)
+            if context:
+                assert context["fight_start"] == single["fight_start"]
+                assert context["total_events"] == single["total_events"]
@@ -216,3 +216,23 @@ class TestCSAtMinute:
         for hero, stats in cs_at_10_minutes.items():
             assert isinstance(stats.get("last_hits", 0), int)
             assert isinstance(stats.get("denies", 0), int)
+
+
+class TestCreepClassification:
+    """Tests for creep name classification."""
+
+    def test_classifies_lane_neutral_and_other(self):
+        from src.services.farming.farming_service import FarmingService
+
+        fs = FarmingService()
+        assert fs._classify_creep("npc_dota_creep_goodguys_melee") == ("lane", None)
+        assert fs._classify_creep("npc_dota_neutral_black_dragon") == ("neutral", "ancient_black_dragon")
+        assert fs._classify_creep("npc_dota_neutral_dark_troll_warlord") == ("neutral", "large_troll")
+        assert fs._classify_creep("npc_dota_neutral_something_new") == ("neutral", "unknown")
+        assert fs._classify_creep("npc_dota_observer_wards") == ("other", None)
+        assert fs._classify_creep("") == ("other", None)
+
+    def test_every_camp_pattern_has_a_tier(self):
+        from src.services.farming.farming_service import CAMP_TYPE_TO_TIER, NEUTRAL_CAMP_PATTERNS
+
+        assert set(NEUTRAL_CAMP_PATTERNS.values()) <= CAMP_TYPE_TO_TIER.keys()
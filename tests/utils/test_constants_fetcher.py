@@ -0,0 +1,39 @@
+"""
+Test suite for constants_fetcher.py
+"""
+
+import json
+import os
+
+from src.utils.constants_fetcher import ConstantsFetcher
+
+
+class TestLoadLocalConstants:
+    """Tests for in-memory caching of local constants files."""
+
+    def test_repeated_loads_reuse_parsed_file(self, tmp_path):
+        (tmp_path / "heroes.json").write_text(json.dumps({"1": {"name": "npc_dota_hero_antimage"}}))
+        fetcher = ConstantsFetcher(data_dir=tmp_path)
+
+        first = fetcher.get_heroes_constants()
+        assert first["1"]["name"] == "npc_dota_hero_antimage"
+        assert fetcher.get_heroes_constants() is first
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        heroes_file = tmp_path / "heroes.json"
+        heroes_file.write_text(json.dumps({"1": {"name": "npc_dota_hero_antimage"}}))
+        fetcher = ConstantsFetcher(data_dir=tmp_path)
+        first = fetcher.get_heroes_constants()
+
+        heroes_file.write_text(json.dumps({"2": {"name": "npc_dota_hero_axe"}}))
+        stat = heroes_file.stat()
+        os.utime(heroes_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = fetcher.get_heroes_constants()
+        assert second is not first
+        assert "2" in second
+
+    def test_missing_file_returns_none(self, tmp_path):
+        fetcher = ConstantsFetcher(data_dir=tmp_path)
+        assert fetcher.load_local_constants("missing.json") is None
+
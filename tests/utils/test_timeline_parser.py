@@ -1,10 +1,9 @@
 """Tests for TimelineParser utility."""
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-import pytest
-
-from src.utils.timeline_parser import TimelineParser
+from src.utils.timeline_parser import EntityTimelineRow, TimelineParser
 
 
 class TestTimelineParserUnit:
@@ -42,22 +41,69 @@ class TestTimelineParserUnit:
         assert result["minute"] == 10
         assert result["players"] == []
 
+    def test_get_stats_at_minute_is_memoized(self):
+        """Test repeated lookups reuse the computed stats without touching the timeline."""
+        parser = TimelineParser()
+        timeline = {"players": [{"player_slot": 0, "team": "radiant", "net_worth": [100, 200, 300]}]}
 
-class TestTimelineParserIntegration:
-    """Integration tests using real replay data."""
+        first = parser.get_stats_at_minute(timeline, 1)
+        assert set(timeline) == {"players"}
+        assert len(parser._stats_cache[id(timeline)][1]) == 1
 
-    @pytest.fixture
-    def parsed_data(self, parsed_replay_data):
-        """Get parsed replay data from conftest fixture."""
-        return parsed_replay_data
+        first["players"][0]["net_worth"] = -1
+        first["players"].clear()
+        second = parser.get_stats_at_minute(timeline, 1)
+        assert second is not first
+        assert second["players"][0]["net_worth"] == 300
+        assert parser.get_stats_at_minute(timeline, 0)["players"][0]["net_worth"] == 100
 
-    def test_parse_timeline_with_real_data(self, parsed_data):
-        """Test timeline parsing with real replay data."""
+    def test_parse_timeline_is_cached_per_replay_file(self, tmp_path):
+        """Test parse_timeline reuses the timeline until the replay file changes."""
         parser = TimelineParser()
-        timeline = parser.parse_timeline(parsed_data)
+        replay = tmp_path / "1.dem"
+        replay.write_bytes(b"x")
+        team = {"players": [{"player_slot": 0, "game_player_id": 0}]}
+        data = MagicMock()
+        data.match_id = 1
+        data.replay_path = str(replay)
+        data.metadata = {"match_id": 1, "metadata": {"teams": [team, team]}}
+        data.entity_snapshots = []
+
+        first = parser.parse_timeline(data)
+        assert parser.parse_timeline(data) is first
+
+        replay.write_bytes(b"xy")
+        assert parser.parse_timeline(data) is not first
+
+    def test_merge_entity_data_builds_slotted_rows(self):
+        """Test entity samples are stored as slotted rows, skipping draft and unknown heroes."""
+        parser = TimelineParser()
+        hero = SimpleNamespace(player_id=0, last_hits=12, denies=3, gold=900, level=5, hero_id=1)
+        other = SimpleNamespace(player_id=7, last_hits=1, denies=0, gold=0, level=1, hero_id=2)
+        snapshots = [
+            SimpleNamespace(game_time=0.0, heroes=[hero]),
+            SimpleNamespace(game_time=185.0, heroes=[hero, other]),
+        ]
+        players = [{"game_player_id": 0}]
+
+        parser._merge_entity_data(players, snapshots)
+
+        rows = players[0]["entity_timeline"]
+        assert len(rows) == 1
+        assert isinstance(rows[0], EntityTimelineRow)
+        assert not hasattr(rows[0], "__dict__")
+        assert rows[0].minute == 3
+        assert rows[0].last_hits == 12
+        assert players[0]["entity_minutes"] == [3]
 
+
+class TestTimelineParserIntegration:
+    """Integration tests using real replay data."""
+
+    def test_parse_timeline_with_real_data(self, parsed_replay_data, timeline):
+        """Test timeline parsing with real replay data."""
         # If metadata is available, timeline should work
-        if parsed_data.metadata is not None:
+        if parsed_replay_data.metadata is not None:
             assert timeline is not None
             assert "players" in timeline
             assert "radiant" in timeline
@@ -68,13 +114,10 @@ class TestTimelineParserIntegration:
             # If no metadata, parsing returns None
             assert timeline is None
 
-    def test_get_stats_at_10_minutes(self, parsed_data):
+    def test_get_stats_at_10_minutes(self, timeline_parser, timeline):
         """Test getting stats at 10 minute mark."""
-        parser = TimelineParser()
-        timeline = parser.parse_timeline(parsed_data)
-
         if timeline is not None:
-            stats = parser.get_stats_at_minute(timeline, 10)
+            stats = timeline_parser.get_stats_at_minute(timeline, 10)
             assert stats["minute"] == 10
             # Should have stats for all 10 players
             assert len(stats["players"]) == 10
@@ -83,11 +126,8 @@ class TestTimelineParserIntegration:
                 assert "team" in player
                 assert player["team"] in ["radiant", "dire"]
 
-    def test_timeline_has_net_worth_progression(self, parsed_data):
+    def test_timeline_has_net_worth_progression(self, timeline):
         """Test that timeline contains net worth progression data."""
-        parser = TimelineParser()
-        timeline = parser.parse_timeline(parsed_data)
-
         if timeline is not None:
             for player in timeline["players"]:
                 nw = player.get("net_worth", [])
@@ -96,11 +136,8 @@ class TestTimelineParserIntegration:
                     # Early game net worth should be less than late game
                     assert nw[-1] >= nw[0], "Net worth should grow over time"
 
-    def test_team_graphs_have_data(self, parsed_data):
+    def test_team_graphs_have_data(self, timeline):
         """Test that team graphs contain XP and gold data."""
-        parser = TimelineParser()
-        timeline = parser.parse_timeline(parsed_data)
-
         if timeline is not None:
             radiant = timeline.get("radiant", {})
             dire = timeline.get("dire", {})